@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Code Nexus - Benchmark Suite
+
+Measures throughput and peak memory of the Module 05 processors, streams
+and pipeline adapters over synthetic datasets, and prints the results as
+JSON so they can be compared between releases.
+
+Usage:
+    python3 benchmark.py [--sizes 1000,10000,...] [--output FILE]
+                         [--only NAME,...] [--no-memory]
+
+Options:
+    --sizes      Comma separated dataset sizes
+                 (default: 1000,10000,100000,1000000)
+    --output     Write the JSON report to FILE instead of stdout
+    --only       Comma separated benchmark names to run
+    --no-memory  Skip the tracemalloc pass (peak memory is reported as null)
+
+Examples:
+    python3 benchmark.py
+    python3 benchmark.py --sizes 1000,10000000 --only numeric_batch
+    python3 benchmark.py --output bench.json
+"""
+
+import argparse
+import importlib.util
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+# Exercise files are found next to this script, whatever the CWD
+BASE_DIR = Path(__file__).resolve().parent
+
+# Benchmark: (name, callable taking the size and returning a runner)
+Benchmark = Tuple[str, Callable[[int], Callable[[], Any]]]
+
+
+def load_module(file_path: str, module_name: str) -> ModuleType:
+    """Load an exercise module from its path relative to BASE_DIR."""
+    spec = importlib.util.spec_from_file_location(module_name,
+                                                  BASE_DIR / file_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not load {file_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_benchmarks() -> List[Benchmark]:
+    """Create every benchmark with its synthetic dataset factory."""
+    ex0 = load_module("ex0/stream_processor.py", "stream_processor")
+    ex1 = load_module("ex1/data_stream.py", "data_stream")
+    ex2 = load_module("ex2/nexus_pipeline.py", "nexus_pipeline")
+    rng = random.Random(42)
+
+    def numeric_list(size: int) -> Callable[[], Any]:
+        data = [rng.random() * 100 for _ in range(size)]
+        processor = ex0.NumericProcessor()
+        return lambda: processor.process(data)
+
+    def numeric_batch(size: int) -> Callable[[], Any]:
+        data = array("d", (rng.random() * 100 for _ in range(size)))
+        processor = ex0.NumericProcessor()
+        return lambda: processor.process_batch(data)
+
+    def sensor_stream(size: int) -> Callable[[], Any]:
+        keys = ["temp", "humidity", "pressure"]
+        data = [f"{keys[i % 3]}:{rng.random() * 100:.1f}"
+                for i in range(size)]
+        stream = ex1.SensorStream("SENSOR_BENCH")
+        return lambda: stream.process_batch(data)
+
+    def transaction_stream(size: int) -> Callable[[], Any]:
+        data = [f"{rng.choice(['buy', 'sell'])}:{rng.randint(1, 500)}"
+                for _ in range(size)]
+        stream = ex1.TransactionStream("TRANS_BENCH")
+        return lambda: stream.process_batch(data)
+
+    def event_stream(size: int) -> Callable[[], Any]:
+        events = ["login", "error", "logout", "warn", "info", "unknown"]
+        data = [rng.choice(events) for _ in range(size)]
+        stream = ex1.EventStream("EVENT_BENCH")
+        return lambda: stream.process_batch(data)
+
+    def adapter(adapter_class: type,
+                make_record: Callable[[int], Any]
+                ) -> Callable[[int], Callable[[], Any]]:
+        def factory(size: int) -> Callable[[], Any]:
+            pipeline = adapter_class("pipeline_bench")
+            for stage in (ex2.InputStage(), ex2.TransformStage(),
+                          ex2.OutputStage()):
+                pipeline.add_stage(stage)
+            records = [make_record(i) for i in range(size)]
+
+            def run() -> None:
+                for record in records:
+                    pipeline.process(record, verbose=False)
+            return run
+        return factory
+
+    return [
+        ("numeric_list", numeric_list),
+        ("numeric_batch", numeric_batch),
+        ("sensor_stream", sensor_stream),
+        ("transaction_stream", transaction_stream),
+        ("event_stream", event_stream),
+        ("json_adapter", adapter(ex2.JSONAdapter, lambda i: {
+            "sensor": "temp", "value": 20 + i % 10, "unit": "C"})),
+        ("csv_adapter", adapter(ex2.CSVAdapter, lambda i: [
+            "user", "action", str(i)])),
+        ("stream_adapter", adapter(ex2.StreamAdapter, lambda i: (
+            f"sensor reading {i}"))),
+    ]
+
+
+def run_benchmark(name: str, factory: Callable[[int], Callable[[], Any]],
+                  size: int, memory: bool) -> Dict[str, Any]:
+    """
+    Time one benchmark, then measure its peak memory in a second run so
+    tracemalloc does not slow down the timed run.
+    """
+    runner = factory(size)
+    start = time.perf_counter()
+    runner()
+    seconds = time.perf_counter() - start
+
+    peak: Optional[int] = None
+    if memory:
+        tracemalloc.start()
+        runner()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "name": name,
+        "size": size,
+        "seconds": round(seconds, 6),
+        "records_per_sec": round(size / seconds) if seconds > 0 else None,
+        "peak_bytes": peak,
+    }
+
+
+def main() -> None:
+    """Run the selected benchmarks and write the JSON report."""
+    parser = argparse.ArgumentParser(description="Code Nexus benchmarks")
+    parser.add_argument("--sizes", default=None,
+                        help="comma separated dataset sizes")
+    parser.add_argument("--output", default=None,
+                        help="write the JSON report to this file")
+    parser.add_argument("--only", default=None,
+                        help="comma separated benchmark names")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the peak memory measurement")
+    args = parser.parse_args()
+
+    sizes = DEFAULT_SIZES
+    if args.sizes:
+        sizes = [int(size) for size in args.sizes.split(",")]
+
+    benchmarks = build_benchmarks()
+    if args.only:
+        wanted = set(args.only.split(","))
+        unknown = wanted - {name for name, _ in benchmarks}
+        if unknown:
+            print(f"Unknown benchmark: {', '.join(sorted(unknown))}",
+                  file=sys.stderr)
+            sys.exit(1)
+        benchmarks = [bench for bench in benchmarks if bench[0] in wanted]
+
+    results = []
+    for name, factory in benchmarks:
+        for size in sizes:
+            print(f"Running {name} ({size} records)...", file=sys.stderr)
+            results.append(run_benchmark(name, factory, size,
+                                         memory=not args.no_memory))
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
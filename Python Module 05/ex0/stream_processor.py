@@ -1,5 +1,166 @@
+import codecs
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+import time
 from abc import ABC, abstractmethod
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor
+from concurrent.futures import wait
 from typing import Any, List, Dict, Union, Optional  # noqa: F401
+from typing import Deque, Iterable, Iterator, TextIO, Tuple
+
+try:
+    import numpy
+except ImportError:  # Optional: only speeds up NumericProcessor.batch_stats
+    numpy = None
+
+
+class OutputSink(ABC):
+    """
+    Abstract destination for processor results. Lines are buffered and
+    written in one call every buffer_size lines instead of one print per
+    record.
+    """
+
+    def __init__(self, buffer_size: int = 1024) -> None:
+        """
+        Initialize the sink with an empty buffer.
+
+        == Args ==
+            - buffer_size (int), default to 1024: Lines kept before an
+            automatic flush.
+        """
+        self.buffer_size = max(buffer_size, 1)
+        self.buffer: List[str] = []
+
+    @abstractmethod
+    def write_lines(self, lines: List[str]) -> None:
+        """
+        Writes a batch of lines to the destination.
+
+        == Args ==
+            - lines (List[str]): The buffered lines.
+        """
+        pass
+
+    def write(self, line: str) -> None:
+        """
+        Adds one result to the buffer, flushing it when full.
+
+        == Args ==
+            - line (str): The formatted result.
+        """
+        self.buffer.append(line)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes every buffered line.
+        """
+        if self.buffer:
+            self.write_lines(self.buffer)
+            self.buffer = []
+
+    def close(self) -> None:
+        """
+        Flushes the buffer and releases the destination.
+        """
+        self.flush()
+
+    def __enter__(self) -> "OutputSink":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class StreamSink(OutputSink):
+    """
+    Sink writing lines to a text stream (stdout by default).
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None,
+                 buffer_size: int = 1024) -> None:
+        """
+        Initialize the sink on a text stream.
+
+        == Args ==
+            - stream (Optional[TextIO]), default to None: Target stream,
+            sys.stdout when None.
+            - buffer_size (int), default to 1024: Lines per write.
+        """
+        super().__init__(buffer_size=buffer_size)
+        self.stream = stream
+
+    def write_lines(self, lines: List[str]) -> None:
+        """
+        Joins the lines and writes them in a single call.
+        """
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write("\n".join(lines) + "\n")
+
+
+class FileSink(StreamSink):
+    """
+    Sink appending lines to a text file.
+    """
+
+    def __init__(self, path: str, buffer_size: int = 1024) -> None:
+        """
+        Initialize the sink and open the file in append mode.
+
+        == Args ==
+            - path (str): The file to append to.
+            - buffer_size (int), default to 1024: Lines per write.
+        """
+        super().__init__(stream=open(path, "a"), buffer_size=buffer_size)
+
+    def close(self) -> None:
+        """
+        Flushes the buffer and closes the file.
+        """
+        super().close()
+        self.stream.close()
+
+
+class JSONLinesSink(FileSink):
+    """
+    Sink appending one JSON object per result to a file.
+    """
+
+    def write_lines(self, lines: List[str]) -> None:
+        """
+        Encodes each line as {"output": line} before writing.
+        """
+        super().write_lines([json.dumps({"output": line}) for line in lines])
+
+
+class ListSink(OutputSink):
+    """
+    Sink keeping every line in memory (useful for tests and callers).
+    """
+
+    def __init__(self, buffer_size: int = 1024) -> None:
+        """
+        Initialize the sink with an empty line list.
+
+        == Args ==
+            - buffer_size (int), default to 1024: Lines per flush.
+        """
+        super().__init__(buffer_size=buffer_size)
+        self.lines: List[str] = []
+
+    def write_lines(self, lines: List[str]) -> None:
+        """
+        Stores the lines.
+        """
+        self.lines.extend(lines)
 
 
 class DataProcessor(ABC):
@@ -8,10 +169,42 @@ class DataProcessor(ABC):
     Enforces a consistent structure for processing different data types.
     """
 
-    @abstractmethod
+    # Error code -> message printed by validate()
+    ERROR_MESSAGES: Dict[str, str] = {}
+
+    # Destination used by emit(), None means print()
+    sink: Optional[OutputSink] = None
+
+    def __init_subclass__(cls: type, **kwargs: Any) -> None:
+        """
+        Refuses processors overriding neither check() nor validate(),
+        whose defaults are implemented with each other.
+        """
+        super().__init_subclass__(**kwargs)
+        if (cls.check is DataProcessor.check
+                and cls.validate is DataProcessor.validate):
+            raise TypeError(f"{cls.__name__} must implement check() or "
+                            "validate()")
+
+    def check(self, data: Any) -> Optional[str]:
+        """
+        Validates the input data without printing or raising. Processors
+        override it; the default keeps processors that only implement
+        validate() working, by running it (and its output) and returning
+        'invalid' when it fails.
+
+        == Args ==
+            - data (Any): The input data to check.
+
+        == Returns ==
+            - Optional[str]: None if data is valid, an error code otherwise.
+        """
+        return None if self.validate(data) else "invalid"
+
     def validate(self, data: Any) -> bool:
         """
-        Validates if the input data is suitable for this processor.
+        Validates if the input data is suitable for this processor and
+        prints the reason when it is not.
 
         == Args ==
             - data (Any): The input data to check.
@@ -19,7 +212,47 @@ class DataProcessor(ABC):
         == Returns ==
             - bool: True if data is valid, False otherwise.
         """
-        pass
+        code = self.check(data)
+        if code is not None:
+            print(self.error_message(code))
+            return False
+        return True
+
+    def error_message(self, code: str) -> str:
+        """
+        Returns the human readable message for an error code.
+
+        == Args ==
+            - code (str): The error code returned by check().
+
+        == Returns ==
+            - str: The message to display.
+        """
+        return self.ERROR_MESSAGES.get(code, f"ERROR: {code}")
+
+    def validate_batch(self, records: Iterable[Any]) -> Dict[str, Any]:
+        """
+        Silently validates many records and aggregates the error codes.
+
+        == Args ==
+            - records (Iterable[Any]): The records to check.
+
+        == Returns ==
+            - Dict[str, Any]: Report with 'total', 'valid', 'invalid' and
+            'errors' (error code -> count).
+        """
+        check = self.check
+        errors: Dict[str, int] = {}
+        total = 0
+        for record in records:
+            total += 1
+            code = check(record)
+            if code is not None:
+                errors[code] = errors.get(code, 0) + 1
+
+        invalid = sum(errors.values())
+        return {"total": total, "valid": total - invalid,
+                "invalid": invalid, "errors": errors}
 
     @abstractmethod
     def process(self, data: Any) -> str:
@@ -34,6 +267,36 @@ class DataProcessor(ABC):
         """
         pass
 
+    def summarize(self, data: Any) -> str:
+        """
+        Processes data already known to be valid, without validating or
+        printing. Defaults to process().
+
+        == Args ==
+            - data (Any): The valid input data.
+
+        == Returns ==
+            - str: The processed and formatted output.
+        """
+        return self.process(data)
+
+    def process_quiet(self, data: Any) -> Tuple[Optional[str], str]:
+        """
+        Silent version of process(): checks the data once and reports the
+        error code instead of printing it.
+
+        == Args ==
+            - data (Any): The input data to process.
+
+        == Returns ==
+            - Tuple[Optional[str], str]: The error code (None if valid)
+            and the formatted output.
+        """
+        code = self.check(data)
+        if code is not None:
+            return code, self.format_output("Error detected. Stopping.")
+        return None, self.summarize(data)
+
     def format_output(self, result: str) -> str:
         """
         Formats the processing result with a standard prefix.
@@ -46,36 +309,82 @@ class DataProcessor(ABC):
         """
         return f"Output: {result}"
 
+    def set_sink(self, sink: Optional[OutputSink]) -> None:
+        """
+        Selects where emit() sends the results of this processor.
+
+        == Args ==
+            - sink (Optional[OutputSink]): The sink, None to print.
+        """
+        self.sink = sink
+
+    def emit(self, data: Any) -> None:
+        """
+        Processes the data and sends the result to the processor's sink.
+
+        == Args ==
+            - data (Any): The input data to process.
+        """
+        result = self.process(data)
+        if self.sink is None:
+            print(result)
+        else:
+            self.sink.write(result)
+
+    def emit_many(self, records: Iterable[Any]) -> None:
+        """
+        Calls emit() for every record, then flushes the sink.
+
+        == Args ==
+            - records (Iterable[Any]): The records to process.
+        """
+        for record in records:
+            self.emit(record)
+        if self.sink is not None:
+            self.sink.flush()
+
 
 class NumericProcessor(DataProcessor):
     """
     Specialized processor for handling lists of numeric values.
     """
 
-    def validate(self, data: List[int]) -> bool:
+    BATCH_FORMATS = frozenset("bBhHiIlLqQfd")
+
+    # Byte-order prefixes that read the same as the native one
+    NATIVE_ORDERS = frozenset(
+        ["", "@", "=", "<" if sys.byteorder == "little" else ">"]
+        + (["!"] if sys.byteorder == "big" else []))
+
+    ERROR_MESSAGES = {
+        "not_list": "[ERROR] Data send is not a list",
+        "empty": "[ERROR] Data is empty",
+        "not_numeric": "[ERROR] Data send is not numeric",
+        "not_buffer": "[ERROR] Data send is not a numeric buffer",
+        "not_contiguous": "[ERROR] Data send is not contiguous",
+        "not_native": "[ERROR] Data send is not in native byte order",
+        "not_finite": "[ERROR] Data contains non finite values",
+    }
+
+    def check(self, data: List[int]) -> Optional[str]:
         """
         Checks if data is a non-empty list of numbers.
         """
-
-        try:
-            if not isinstance(data, list):
-                raise ValueError
-        except ValueError:
-            print("[ERROR] Data send is not a list")
-            return False
+        if not isinstance(data, list):
+            return "not_list"
 
         if len(data) == 0:
-            print("[ERROR] Data is empty")
-            return False
+            return "empty"
 
         for number in data:
+            if isinstance(number, (int, float)):
+                continue
             try:
                 float(number)
             except (ValueError, TypeError):
-                print("[ERROR] Data send is not numeric")
-                return False
+                return "not_numeric"
 
-        return True
+        return None
 
     def process(self, data: List[int]) -> str:
         """
@@ -83,7 +392,12 @@ class NumericProcessor(DataProcessor):
         """
         if not self.validate(data):
             return self.format_output("Error detected. Stopping.")
+        return self.summarize(data)
 
+    def summarize(self, data: List[int]) -> str:
+        """
+        Sum and average of a list already checked.
+        """
         total = 0
         for number in data:
             total += float(number)
@@ -94,6 +408,132 @@ class NumericProcessor(DataProcessor):
                       f"avg={avg}")
         return self.format_output(result_str)
 
+    def batch_view(self, data: Any
+                   ) -> Tuple[Optional[memoryview], Optional[str]]:
+        """
+        Checks if data is a flat numeric buffer and returns a view on it,
+        without printing. Works with array.array, memoryview, bytes-like
+        and NumPy arrays without copying (only their buffer is used).
+        Values must be in native byte order and size.
+
+        == Args ==
+            - data (Any): The buffer to check.
+
+        == Returns ==
+            - Tuple[Optional[memoryview], Optional[str]]: A 1-D view on the
+            numbers and None, or None and the error code.
+        """
+        try:
+            view = memoryview(data)
+        except TypeError:
+            return None, "not_buffer"
+
+        item_format = view.format.lstrip("@=<>!")
+        if item_format not in self.BATCH_FORMATS:
+            return None, "not_numeric"
+
+        byte_order = view.format[:len(view.format) - len(item_format)]
+        if (byte_order not in self.NATIVE_ORDERS
+                or view.itemsize != struct.calcsize(item_format)):
+            return None, "not_native"
+
+        if view.ndim != 1 or view.format != item_format:
+            if not view.c_contiguous:
+                return None, "not_contiguous"
+            view = view.cast("B").cast(item_format)
+
+        if len(view) == 0:
+            return None, "empty"
+
+        return view, None
+
+    def batch_stats(self, data: Any
+                    ) -> Tuple[Optional[Dict[str, float]], Optional[str]]:
+        """
+        Calculates count, sum, avg, min, max and stddev of a numeric buffer.
+        Without NumPy, every aggregate comes from a single pass over the
+        view. The sums are taken relative to the first value (shifted data
+        variance), so the result stays accurate when the values share a
+        large offset. The buffer is not copied, but each value is still
+        read as a Python number. With NumPy installed the work is done in
+        C instead.
+
+        == Args ==
+            - data (Any): array.array('d'), memoryview or NumPy array.
+
+        == Returns ==
+            - Tuple[Optional[Dict[str, float]], Optional[str]]: The
+            statistics and None, or None and the error code.
+        """
+        view, code = self.batch_view(data)
+        if view is None:
+            return None, code
+
+        if numpy is not None:
+            stats = self._numpy_stats(view)
+        else:
+            stats = self._shifted_stats(view)
+
+        if not all(math.isfinite(value) for value in stats.values()):
+            return None, "not_finite"
+        return stats, None
+
+    @staticmethod
+    def _shifted_stats(view: memoryview) -> Dict[str, float]:
+        """Single-pass statistics of a non-empty view."""
+        count = len(view)
+        shift = low = high = view[0]
+        deltas = 0.0
+        squares = 0.0
+        for value in view:
+            delta = value - shift
+            deltas += delta
+            squares += delta * delta
+            if value < low:
+                low = value
+            elif value > high:
+                high = value
+
+        mean_delta = deltas / count
+        variance = max(squares / count - mean_delta * mean_delta, 0.0)
+        return {
+            "count": count,
+            "sum": shift * count + deltas,
+            "avg": shift + mean_delta,
+            "min": float(low),
+            "max": float(high),
+            "stddev": math.sqrt(variance),
+        }
+
+    @staticmethod
+    def _numpy_stats(view: memoryview) -> Dict[str, float]:
+        """Same as _shifted_stats(), computed by NumPy."""
+        values = numpy.asarray(view)
+        with numpy.errstate(all="ignore"):
+            return {
+                "count": len(values),
+                "sum": float(values.sum(dtype=numpy.float64)),
+                "avg": float(values.mean(dtype=numpy.float64)),
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "stddev": float(values.std(dtype=numpy.float64)),
+            }
+
+    def process_batch(self, data: Any) -> str:
+        """
+        Columnar version of process() for large numeric buffers.
+        """
+        stats, code = self.batch_stats(data)
+        if stats is None:
+            print(self.error_message(code))
+            return self.format_output("Error detected. Stopping.")
+
+        result_str = (f"Processed {stats['count']} numeric values, "
+                      f"sum={stats['sum']}, avg={stats['avg']}, "
+                      f"min={stats['min']}, max={stats['max']}, "
+                      f"stddev={stats['stddev']:.4f}")
+        return self.format_output(result_str)
+
     def format_output(self, result: str) -> str:
         """
         Formats the output specifically for Numeric data.
@@ -106,19 +546,22 @@ class TextProcessor(DataProcessor):
     Specialized processor for handling text.
     """
 
-    def validate(self, data: str) -> bool:
+    WORD_PATTERN = re.compile(r"\S+")
+    TRAILING_WORD = re.compile(r"\S*\Z")
+    SCAN_SIZE = 1 << 20
+
+    ERROR_MESSAGES = {
+        "not_string": "ERROR: Data is not a string",
+    }
+
+    def check(self, data: str) -> Optional[str]:
         """
         Checks if data is a string.
         """
+        if not isinstance(data, str):
+            return "not_string"
 
-        try:
-            if not isinstance(data, str):
-                raise ValueError
-        except ValueError:
-            print("ERROR: Data is not a string")
-            return False
-
-        return True
+        return None
 
     def process(self, data: str) -> str:
         """
@@ -128,7 +571,12 @@ class TextProcessor(DataProcessor):
         if not self.validate(data):
             result_str = "Error detected. Stopping."
             return self.format_output(result_str)
+        return self.summarize(data)
 
+    def summarize(self, data: str) -> str:
+        """
+        Characters and words of a string already checked.
+        """
         characters_count = len(data)
         words_count = len(data.split())
 
@@ -137,6 +585,85 @@ class TextProcessor(DataProcessor):
 
         return self.format_output(result_str)
 
+    def text_stats(self, data: Union[str, bytes, mmap.mmap],
+                   top_n: int = 10) -> Dict[str, Any]:
+        """
+        Counts characters, words, lines and the most frequent words
+        without building the token list: words are read with re.finditer
+        and bytes / mmap are decoded in bounded slices, never as a whole.
+        Words are split on Unicode whitespace like str.split(), so every
+        input type gives the same counts as process(). Only the word
+        counter grows with the vocabulary.
+
+        == Args ==
+            - data (Union[str, bytes, mmap.mmap]): The text (bytes and
+            mmap are read as UTF-8).
+            - top_n (int), default to 10: Number of frequent words to keep.
+
+        == Returns ==
+            - Dict[str, Any]: 'characters', 'words', 'lines' and 'top_words'
+            (list of (word, count) tuples).
+        """
+        words = self.WORD_PATTERN
+        frequencies: Counter = Counter()
+        characters = 0
+        lines = 0
+        last = ""
+        carry = ""
+        for text in self._decoded(data):
+            characters += len(text)
+            lines += text.count("\n")
+            last = text[-1:] or last
+            # A word cut at the end of a slice is finished by the next one
+            text = carry + text
+            cut = self.TRAILING_WORD.search(text).start()
+            frequencies.update(match.group()
+                               for match in words.finditer(text, 0, cut))
+            carry = text[cut:]
+        if carry:
+            frequencies[carry] += 1
+
+        if last and last != "\n":
+            lines += 1
+
+        return {"characters": characters,
+                "words": sum(frequencies.values()),
+                "lines": lines,
+                "top_words": frequencies.most_common(top_n)}
+
+    def _decoded(self, data: Union[str, bytes, mmap.mmap]) -> Iterator[str]:
+        """
+        Yields the text as str, decoding bytes / mmap as UTF-8 in
+        SCAN_SIZE slices (characters split between slices are kept).
+        """
+        if isinstance(data, str):
+            yield data
+            return
+
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        for start in range(0, len(data), self.SCAN_SIZE):
+            yield decoder.decode(data[start:start + self.SCAN_SIZE])
+        yield decoder.decode(b"", final=True)
+
+    def file_stats(self, path: str, top_n: int = 10) -> Dict[str, Any]:
+        """
+        Same as text_stats() on a file mapped in memory, so even very
+        large dumps are read straight from the page cache.
+
+        == Args ==
+            - path (str): Path of the text file.
+            - top_n (int), default to 10: Number of frequent words to keep.
+
+        == Returns ==
+            - Dict[str, Any]: See text_stats().
+        """
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return self.text_stats(b"", top_n=top_n)
+            with mmap.mmap(file.fileno(), 0,
+                           access=mmap.ACCESS_READ) as mapped:
+                return self.text_stats(mapped, top_n=top_n)
+
     def format_output(self, result: str) -> str:
         """
         Formats the output specifically for Text data.
@@ -147,33 +674,71 @@ class TextProcessor(DataProcessor):
 class LogProcessor(DataProcessor):
     """Class for log"""
 
-    def validate(self, data: str) -> bool:
+    # Default registry: log level -> alert tag
+    LEVELS: Dict[str, str] = {
+        "ERROR": "[ALERT]",
+        "WARN": "[ALERT]",
+        "INFO": "[INFO]",
+        "DEBUG": "[INFO]",
+        "LOG": "[INFO]",
+    }
+
+    ERROR_MESSAGES = {
+        "not_string": "ERROR: Data is not a string",
+        "missing_separator": ("ERROR: Invalid format. Missing ':' separator. "
+                              "Please use: 'LOGTYPE': [msg]\nValid 'LOGTYPE' "
+                              "= {levels}"),
+        "invalid_level": ("ERROR: Data is not log type. Please use: "
+                          "'LOGTYPE': [msg]\nValid 'LOGTYPE' = {levels}"),
+    }
+
+    def __init__(self) -> None:
         """
-        Checks if data is a string.
+        Initialize the level registry and the per-level counters used by
+        the streaming API.
         """
+        self.levels: Dict[str, str] = dict(self.LEVELS)
+        self.level_counts: Dict[str, int] = {}
+        self.invalid_count = 0
 
-        try:
-            if not isinstance(data, str):
-                raise ValueError
-        except ValueError:
-            print("ERROR: Data is not a string")
-            return False
+    def register_level(self, level: str, alert: bool = False) -> None:
+        """
+        Adds (or replaces) a custom log level in this processor's registry.
 
-        if ":" not in data:
-            print("ERROR: Invalid format. Missing ':' separator. Please use: "
-                  "'LOGTYPE': [msg]\nValid 'LOGTYPE' = 'ERROR','WARN','INFO',"
-                  "'DEBUG','LOG'")
-            return False
+        == Args ==
+            - level (str): The log level name (e.g. 'CRITICAL').
+            - alert (bool), default to False: Tag the level as [ALERT].
+        """
+        self.levels[level.strip()] = "[ALERT]" if alert else "[INFO]"
 
-        valid_logtype = ["ERROR", "INFO", "WARN", "DEBUG", "LOG"]
-        alert = data.split(":")
-        log_type = alert[0].strip()
-        if log_type not in valid_logtype:
-            print("ERROR: Data is not log type. Please use: 'LOGTYPE': [msg]"
-                  "\nValid 'LOGTYPE' = 'ERROR','WARN','INFO','DEBUG','LOG'")
-            return False
+    def _valid_levels(self) -> str:
+        """
+        Builds the list of valid levels shown in error messages.
+        """
+        return ",".join(f"'{level}'" for level in self.levels)
 
-        return True
+    def check(self, data: str) -> Optional[str]:
+        """
+        Checks if data is a string with a registered log level.
+        """
+        if not isinstance(data, str):
+            return "not_string"
+
+        log_type, separator, _ = data.partition(":")
+        if not separator:
+            return "missing_separator"
+
+        if log_type.strip() not in self.levels:
+            return "invalid_level"
+
+        return None
+
+    def error_message(self, code: str) -> str:
+        """
+        Formats the error messages with the registered log levels.
+        """
+        message = self.ERROR_MESSAGES.get(code, f"ERROR: {code}")
+        return message.format(levels=self._valid_levels())
 
     def process(self, data: str) -> str:
         """
@@ -183,19 +748,71 @@ class LogProcessor(DataProcessor):
         if not self.validate(data):
             result_str = "Error detected. Stopping."
             return self.format_output(result_str)
+        return self.summarize(data)
 
-        alert = data.split(":")
-        logtype_alert = ["ERROR", "WARN"]
-
-        if alert[0] in logtype_alert:
-            alert_type = "[ALERT]"
-        else:
-            alert_type = "[INFO]"
+    def summarize(self, data: str) -> str:
+        """
+        Formats a log entry already checked.
+        """
+        log_type, _, message = data.partition(":")
+        log_type = log_type.strip()
 
-        result_str = f"{alert_type} {alert[0]} level detected:{alert[1]}"
+        result_str = (f"{self.levels[log_type]} {log_type} level "
+                      f"detected:{message}")
 
         return self.format_output(result_str)
 
+    def parse_line(self, line: str) -> Optional[Dict[str, str]]:
+        """
+        Splits a single 'LEVEL: msg' line into a record, without printing.
+
+        == Args ==
+            - line (str): The raw log line.
+
+        == Returns ==
+            - Optional[Dict[str, str]]: The record with 'level', 'message'
+            and 'alert' keys, or None if the line is not a valid log entry.
+        """
+        level, separator, message = line.partition(":")
+        level = level.strip()
+        alert_type = self.levels.get(level)
+        if not separator or alert_type is None:
+            return None
+
+        return {"level": level, "message": message.strip(),
+                "alert": alert_type}
+
+    def stream(self, source: Union[str, Iterable[str]]
+               ) -> Iterator[Dict[str, str]]:
+        """
+        Parses a log file or an iterable of lines one line at a time.
+        Each line is split once, and level_counts / invalid_count are
+        updated as records are yielded, so the whole log is never held in
+        memory.
+
+        == Args ==
+            - source (Union[str, Iterable[str]]): A file path, or any
+            iterable of log lines (open file, list, generator...).
+
+        == Yields ==
+            - Dict[str, str]: One record per valid log line.
+        """
+        if isinstance(source, str):
+            with open(source, "r") as file:
+                yield from self.stream(file)
+            return
+
+        counts = self.level_counts
+        for line in source:
+            record = self.parse_line(line)
+            if record is None:
+                if line.strip():
+                    self.invalid_count += 1
+                continue
+            level = record["level"]
+            counts[level] = counts.get(level, 0) + 1
+            yield record
+
     def format_output(self, result: str) -> str:
         """
         Formats the output specifically for Log data.
@@ -203,6 +820,137 @@ class LogProcessor(DataProcessor):
         return f"Output: {result}"
 
 
+def route_item(processors: Dict[str, DataProcessor], item: Any) -> str:
+    """
+    Picks the processor key for a single item of a mixed feed.
+
+    == Arguments ==
+        - processors (Dict[str, DataProcessor]): Processors by key.
+        - item (Any): The item to route.
+
+    == Returns ==
+        - str: 'log' for valid log lines, 'text' for other strings,
+        'numeric' for everything else.
+    """
+    if isinstance(item, str):
+        if processors["log"].check(item) is None:
+            return "log"
+        return "text"
+    return "numeric"
+
+
+def process_chunk(processors: Dict[str, DataProcessor],
+                  chunk: List[Any]) -> List[str]:
+    """
+    Routes and processes a chunk of items. Runs inside a worker process,
+    so invalid items are reported without printing, and every item is
+    checked once by its processor.
+
+    == Arguments ==
+        - processors (Dict[str, DataProcessor]): Processors by key.
+        - chunk (List[Any]): The items to process.
+
+    == Returns ==
+        - List[str]: One formatted result per item, in chunk order.
+    """
+    results = []
+    for item in chunk:
+        key = route_item(processors, item)
+        if key == "log":
+            # route_item() has already checked the line
+            results.append(processors["log"].summarize(item))
+        else:
+            results.append(processors[key].process_quiet(item)[1])
+    return results
+
+
+class ProcessorDispatcher():
+    """
+    Routes the items of a mixed feed to the right DataProcessor and fans
+    chunks out to a pool of worker processes.
+    """
+
+    def __init__(self, chunk_size: int = 1000,
+                 max_workers: Optional[int] = None,
+                 ordered: bool = True) -> None:
+        """
+        Initialize the dispatcher with one processor per data type.
+
+        == Args ==
+            - chunk_size (int), default to 1000: Items sent per task.
+            - max_workers (Optional[int]), default to None: Pool size
+            (None uses every core).
+            - ordered (bool), default to True: Yield results in input
+            order, otherwise as soon as a chunk is done.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.ordered = ordered
+        self.processors: Dict[str, DataProcessor] = {
+            "numeric": NumericProcessor(),
+            "text": TextProcessor(),
+            "log": LogProcessor(),
+        }
+
+    def route(self, item: Any) -> DataProcessor:
+        """
+        Returns the processor that handles this item.
+        """
+        return self.processors[route_item(self.processors, item)]
+
+    def _chunks(self, items: Iterable[Any]) -> Iterator[List[Any]]:
+        """
+        Groups the feed into lists of chunk_size items.
+        """
+        chunk = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) == self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def dispatch(self, items: Iterable[Any]) -> Iterator[str]:
+        """
+        Processes a mixed feed on every core. At most two chunks per
+        worker are in flight, so the feed is consumed lazily.
+
+        == Args ==
+            - items (Iterable[Any]): The mixed feed.
+
+        == Yields ==
+            - str: One formatted result per item.
+        """
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            limit = (self.max_workers or os.cpu_count() or 1) * 2
+            pending: Deque[Future] = deque()
+
+            for chunk in self._chunks(items):
+                pending.append(pool.submit(process_chunk, self.processors,
+                                           chunk))
+                if len(pending) >= limit:
+                    yield from self._collect(pending)
+
+            while pending:
+                yield from self._collect(pending)
+
+    def _collect(self, pending: Deque[Future]) -> Iterator[str]:
+        """
+        Yields the results of the next finished chunk(s).
+        """
+        if self.ordered:
+            yield from pending.popleft().result()
+            return
+
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+            yield from future.result()
+
+
 def errors_tester(tester: str) -> None:
     """
     Function to test errors handling for invalid data.
@@ -343,6 +1091,50 @@ def errors_tester(tester: str) -> None:
         print("Invalid name. Please use: 'numeric', 'text' or 'log'.")
 
 
+def log_benchmark(lines: int = 1_000_000) -> None:
+    """
+    Microbenchmark of the log parser on a synthetic log, comparing the
+    original split()/list based parsing with the registry based one.
+
+    == Arguments ==
+        - lines (int), default to 1_000_000: Number of log lines.
+
+    == Returns ==
+        - None: This function only print to stdout.
+    """
+
+    def legacy_parse(line: str) -> Optional[Dict[str, str]]:
+        if ":" not in line:
+            return None
+        valid_logtype = ["ERROR", "INFO", "WARN", "DEBUG", "LOG"]
+        if line.split(":")[0].strip() not in valid_logtype:
+            return None
+        alert = line.split(":")
+        logtype_alert = ["ERROR", "WARN"]
+        if alert[0] in logtype_alert:
+            alert_type = "[ALERT]"
+        else:
+            alert_type = "[INFO]"
+        return {"level": alert[0], "message": alert[1].strip(),
+                "alert": alert_type}
+
+    print(f"\n=== Log parser benchmark ({lines} lines) ===\n")
+
+    samples = ["ERROR: Connection timeout", "INFO: System ready",
+               "WARN: Disk almost full", "DEBUG: x=42", "LOG: heartbeat",
+               "EROR: typo", "no separator"]
+    log = [samples[i % len(samples)] for i in range(lines)]
+    processor = LogProcessor()
+
+    for name, parse in (("before", legacy_parse),
+                        ("after", processor.parse_line)):
+        start = time.perf_counter()
+        for line in log:
+            parse(line)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>6}: {elapsed:.3f}s, {lines / elapsed:,.0f} lines/s")
+
+
 def main() -> None:
     """
     Program entry point.
@@ -401,6 +1193,7 @@ def main() -> None:
 
     # If you want to test errors, remove the comment from the function call.
     # errors_tester("log")
+    # log_benchmark()
 
     print("\n=== Polymorphic Processing Demo ===")
     print("Processing multiple data types through same interface...")
@@ -1,5 +1,235 @@
+import asyncio
+import fnmatch
+import hashlib
+import heapq
+import math
+import operator
+import os
+import pickle
+import tempfile
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from decimal import Decimal
 from typing import Any, List, Dict, Union, Optional
+from typing import AsyncIterable, Callable, Deque, Iterable, Iterator
+from typing import Tuple
+
+
+class Predicate():
+    """
+    Composable filter rule. Predicates combine with & (AND), | (OR) and
+    ~ (NOT), with each other or with plain callables. A combination calls
+    the wrapped functions of its operands directly, so an item costs one
+    function call per operator and per leaf rule, without going through
+    Predicate.__call__().
+    """
+
+    def __init__(self, function: Callable[[Any], bool]) -> None:
+        """
+        Wrap a test function.
+
+        === Args ===
+            function (Callable[[Any], bool]): Returns True to keep an item.
+        """
+        self.function = function
+
+    def __call__(self, item: Any) -> bool:
+        return self.function(item)
+
+    @staticmethod
+    def unwrap(rule: Callable[[Any], bool]) -> Callable[[Any], bool]:
+        """
+        Return the test function of a Predicate, or a plain callable as is.
+        """
+        if isinstance(rule, Predicate):
+            return rule.function
+        return rule
+
+    def __and__(self, other: Callable[[Any], bool]) -> "Predicate":
+        left, right = self.function, self.unwrap(other)
+        return Predicate(lambda item: left(item) and right(item))
+
+    def __rand__(self, other: Callable[[Any], bool]) -> "Predicate":
+        left, right = self.unwrap(other), self.function
+        return Predicate(lambda item: left(item) and right(item))
+
+    def __or__(self, other: Callable[[Any], bool]) -> "Predicate":
+        left, right = self.function, self.unwrap(other)
+        return Predicate(lambda item: left(item) or right(item))
+
+    def __ror__(self, other: Callable[[Any], bool]) -> "Predicate":
+        left, right = self.unwrap(other), self.function
+        return Predicate(lambda item: left(item) or right(item))
+
+    def __invert__(self) -> "Predicate":
+        function = self.function
+        return Predicate(lambda item: not function(item))
+
+
+COMPARATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "<": operator.lt, "<=": operator.le, "==": operator.eq,
+    "!=": operator.ne, ">=": operator.ge, ">": operator.gt,
+}
+
+
+def contains(text: str) -> Predicate:
+    """
+    Keep items containing a substring.
+
+    === Args ===
+        text (str): The substring to look for.
+
+    === Returns ===
+        Predicate: The rule.
+    """
+    return Predicate(lambda item: text in item)
+
+
+def one_of(*values: Any) -> Predicate:
+    """
+    Keep items equal to one of the values.
+
+    === Args ===
+        values (Any): The accepted values.
+
+    === Returns ===
+        Predicate: The rule.
+    """
+    accepted = frozenset(values)
+    return Predicate(lambda item: item in accepted)
+
+
+def field(key: Optional[str], comparator: str, value: float) -> Predicate:
+    """
+    Compare the value of 'key:value' records (e.g., field('temp', '>', 30)).
+
+    === Args ===
+        key (Optional[str]): The record key, None to accept any key.
+        comparator (str): One of <, <=, ==, !=, >=, >.
+        value (float): The value to compare with.
+
+    === Returns ===
+        Predicate: The rule. Records that do not parse are rejected.
+    """
+    compare = COMPARATORS[comparator]
+
+    def test(item: Any) -> bool:
+        if not isinstance(item, str):
+            return False
+        item_key, separator, item_value = item.partition(":")
+        if not separator or (key is not None and item_key != key):
+            return False
+        try:
+            return compare(float(item_value), value)
+        except ValueError:
+            return False
+
+    return Predicate(test)
+
+
+class EventTimeBuffer():
+    """
+    Bounded reorder buffer for (timestamp, record) pairs.
+
+    The watermark trails the highest timestamp seen by max_delay. Records
+    are held until the watermark passes them, then released in timestamp
+    order. Records behind the watermark are still released (as late) if
+    within allowed_lateness, otherwise dropped and counted.
+    """
+
+    def __init__(self, max_delay: float, allowed_lateness: float = 0.0,
+                 capacity: int = 10_000) -> None:
+        """
+        Initialize an empty buffer.
+
+        === Args ===
+            max_delay (float): Out-of-order delay tolerated before a
+            record is released.
+            allowed_lateness (float): How far behind the watermark a
+            record may still be accepted. Defaults to 0.
+            capacity (int): Maximum records held; beyond it the oldest
+            are released early. Defaults to 10_000.
+        """
+        if max_delay < 0 or allowed_lateness < 0 or capacity < 1:
+            raise ValueError("max_delay and allowed_lateness must be >= 0 "
+                             "and capacity >= 1")
+        self.max_delay = max_delay
+        self.allowed_lateness = allowed_lateness
+        self.capacity = capacity
+        self.heap: List[Tuple[float, int, Any]] = []
+        self.sequence = 0
+        self.watermark = -math.inf
+        self.late_accepted = 0
+        self.late_dropped = 0
+        self.forced_releases = 0
+
+    def push(self, records: Iterable[Tuple[float, Any]]
+             ) -> List[Tuple[float, Any]]:
+        """
+        Add records and return the ones ready to be processed.
+
+        === Args ===
+            records (Iterable[Tuple[float, Any]]): (timestamp, record)
+            pairs in arrival order.
+
+        === Returns ===
+            List[Tuple[float, Any]]: Released pairs, in timestamp order.
+        """
+        released = []
+        heap = self.heap
+        for timestamp, record in records:
+            if timestamp < self.watermark:
+                if timestamp >= self.watermark - self.allowed_lateness:
+                    self.late_accepted += 1
+                    released.append((timestamp, record))
+                else:
+                    self.late_dropped += 1
+                continue
+
+            heapq.heappush(heap, (timestamp, self.sequence, record))
+            self.sequence += 1
+            self.watermark = max(self.watermark, timestamp - self.max_delay)
+
+            if len(heap) > self.capacity:
+                self.forced_releases += 1
+                oldest, _, item = heapq.heappop(heap)
+                self.watermark = max(self.watermark, oldest)
+                released.append((oldest, item))
+
+        while heap and heap[0][0] <= self.watermark:
+            timestamp, _, record = heapq.heappop(heap)
+            released.append((timestamp, record))
+        # Late and forced releases were appended as they came
+        released.sort(key=operator.itemgetter(0))
+        return released
+
+    def flush(self) -> List[Tuple[float, Any]]:
+        """
+        Release every buffered record in timestamp order.
+
+        === Returns ===
+            List[Tuple[float, Any]]: The released pairs.
+        """
+        released = [(timestamp, record) for timestamp, _, record
+                    in sorted(self.heap)]
+        self.heap = []
+        if released:
+            self.watermark = max(self.watermark, released[-1][0])
+        return released
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Buffer metrics.
+
+        === Returns ===
+            Dict[str, Union[int, float]]: watermark, buffered, late
+            accepted / dropped and forced releases.
+        """
+        return {"watermark": self.watermark, "buffered": len(self.heap),
+                "late_accepted": self.late_accepted,
+                "late_dropped": self.late_dropped,
+                "forced_releases": self.forced_releases}
 
 
 class DataStream(ABC):
@@ -12,6 +242,9 @@ class DataStream(ABC):
     and retrieving stream statistics.
     """
 
+    # Rule used by filter_data(criteria="high-priority")
+    HIGH_PRIORITY: Optional[Predicate] = None
+
     def __init__(self, stream_id: str, stream_type: str) -> None:
         """
         Initialize the DataStream instance.
@@ -22,6 +255,12 @@ class DataStream(ABC):
         """
         self.stream_id = stream_id
         self.stream_type = stream_type
+        self.batches = 0
+        self.records_seen = 0
+        self.error_count = 0
+        self.processing_time = 0.0
+        self.event_time: Optional[EventTimeBuffer] = None
+        self.state_version = 0
 
     @abstractmethod
     def process_batch(self, data_batch: List[Any]) -> str:
@@ -36,25 +275,153 @@ class DataStream(ABC):
         """
         pass
 
-    def filter_data(self, data_batch: List[Any],
-                    criteria: Optional[str] = None) -> List[Any]:
+    def filter_data(self, data_batch: Iterable[Any],
+                    criteria: Union[str, Predicate, Callable[[Any], bool],
+                                    None] = None) -> Iterator[Any]:
+        """
+        Lazily filter data based on a specific criteria. Nothing is copied:
+        filters can be chained and the items are only read when the
+        result is consumed.
+
+        === Args ===
+            data_batch (Iterable[Any]): Any iterable of data.
+            criteria (Union[str, Predicate, Callable, None]): A keyword to
+            look for, 'high-priority' for the stream's HIGH_PRIORITY rule,
+            or a predicate. Defaults to None.
+
+        === Returns ===
+            Iterator[Any]: The items matching the criteria.
+        """
+        if criteria is None:
+            return iter(data_batch)
+
+        if criteria == "high-priority":
+            if self.HIGH_PRIORITY is None:
+                return iter(data_batch)
+            criteria = self.HIGH_PRIORITY
+        elif isinstance(criteria, str):
+            criteria = contains(criteria)
+
+        if isinstance(criteria, Predicate):
+            criteria = criteria.function
+        return filter(criteria, data_batch)
+
+    def enable_event_time(self, max_delay: float,
+                          allowed_lateness: float = 0.0,
+                          capacity: int = 10_000) -> None:
+        """
+        Turn on event-time processing for process_events().
+
+        === Args ===
+            max_delay (float): Out-of-order delay tolerated.
+            allowed_lateness (float): Extra lateness accepted behind the
+            watermark. Defaults to 0.
+            capacity (int): Reorder buffer size. Defaults to 10_000.
+        """
+        self.event_time = EventTimeBuffer(max_delay=max_delay,
+                                          allowed_lateness=allowed_lateness,
+                                          capacity=capacity)
+        self.mark_dirty()
+
+    def release_events(self, records: Iterable[Tuple[float, Any]],
+                       flush: bool = False) -> List[Tuple[float, Any]]:
+        """
+        Push timestamped records through the reorder buffer.
+
+        === Args ===
+            records (Iterable[Tuple[float, Any]]): (timestamp, record)
+            pairs in arrival order.
+            flush (bool): Release everything still buffered (end of feed).
+            Defaults to False.
+
+        === Returns ===
+            List[Tuple[float, Any]]: The pairs ready to be processed.
+        """
+        if self.event_time is None:
+            raise ValueError(f"Stream {self.stream_id} has no event time, "
+                             "call enable_event_time() first")
+        self.state_version += 1
+        released = self.event_time.push(records)
+        if flush:
+            released.extend(self.event_time.flush())
+        return released
+
+    def process_events(self, records: Iterable[Tuple[float, Any]],
+                       flush: bool = False) -> Optional[str]:
+        """
+        Reorder timestamped records, then process the released ones as a
+        batch, in event-time order.
+
+        === Args ===
+            records (Iterable[Tuple[float, Any]]): (timestamp, record)
+            pairs in arrival order.
+            flush (bool): Release everything still buffered (end of feed).
+            Defaults to False.
+
+        === Returns ===
+            Optional[str]: The process_batch() result, or None if nothing
+            was released yet.
+        """
+        released = self.release_events(records, flush=flush)
+        if not released:
+            return None
+        return self.process_batch([record for _, record in released])
+
+    def update_stats(self, records: int, errors: int,
+                     elapsed: float) -> None:
         """
-        Filter the data batch based on a specific criteria.
+        Add the counters of one processed batch to the stream state.
+        Called by process_batch(), O(1) whatever the history.
 
         === Args ===
-            data_batch (List[Any]): The original list of data.
-            criteria (Optional[str]): The keyword to filter by.
-            Defaults to None.
+            records (int): Number of records in the batch.
+            errors (int): Number of invalid records in the batch.
+            elapsed (float): Time spent processing the batch, in seconds.
+        """
+        self.state_version += 1
+        self.batches += 1
+        self.records_seen += records
+        self.error_count += errors
+        self.processing_time += elapsed
+
+    def mark_dirty(self) -> None:
+        """
+        Flag the state as changed for incremental checkpoints. Call it
+        after changing the state in place without update_stats().
+        """
+        self.state_version += 1
+
+    def state_signature(self) -> Tuple[Any, ...]:
+        """
+        Cheap summary of the state used by incremental checkpoints: the
+        state version and the identity of every attribute, so assigning
+        an attribute is noticed even if the version did not move.
+
+        === Returns ===
+            Tuple[Any, ...]: Equal signatures mean an unchanged state,
+            unless an attribute was mutated in place (see mark_dirty()).
+        """
+        return (self.state_version,
+                tuple((name, id(value))
+                      for name, value in self.__dict__.items()))
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Snapshot of the stream state for checkpoints.
 
         === Returns ===
-            List[Any]: The filtered list of data.
+            Dict[str, Any]: A shallow copy of the instance attributes.
         """
-        if criteria is not None:
-            data_batch_filtered = [item for item in data_batch
-                                   if criteria in item]
-            return data_batch_filtered
+        return dict(self.__dict__)
 
-        return data_batch
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Restore a state produced by get_state().
+
+        === Args ===
+            state (Dict[str, Any]): The saved attributes.
+        """
+        self.__dict__.update(state)
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
         """
@@ -62,29 +429,419 @@ class DataStream(ABC):
 
         === Returns ===
             Dict[str, Union[str, int, float]]: A dictionary containing
-            the stream ID and type.
+            the stream ID and type, and the cumulative counters (batches,
+            records, errors, throughput in records/sec).
         """
-        stat = {"id": self.stream_id, "type": self.stream_type}
+        throughput = 0.0
+        if self.processing_time > 0:
+            throughput = self.records_seen / self.processing_time
+
+        stat = {"id": self.stream_id, "type": self.stream_type,
+                "batches": self.batches, "records": self.records_seen,
+                "errors": self.error_count, "throughput": throughput}
+        if self.event_time is not None:
+            stat.update(self.event_time.get_stats())
         return stat
 
 
+class RunningStats():
+    """
+    Running count, mean, min, max and variance of a metric, updated in O(1)
+    per value (Welford's algorithm) without keeping the values.
+    """
+
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self) -> None:
+        """
+        Initialize empty statistics.
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """
+        Add one value to the statistics.
+
+        === Args ===
+            value (float): The new reading.
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "RunningStats") -> None:
+        """
+        Combine another RunningStats into this one in O(1).
+
+        === Args ===
+            other (RunningStats): The statistics to merge.
+        """
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """
+        Population variance of the values seen so far.
+        """
+        if self.count == 0:
+            return 0.0
+        return self.m2 / self.count
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Export the statistics as a dictionary.
+
+        === Returns ===
+            Dict[str, float]: count, mean, min, max and variance.
+        """
+        return {"count": self.count, "mean": self.mean, "min": self.min,
+                "max": self.max, "variance": self.variance}
+
+
+class SpaceSaving():
+    """
+    Approximate top-K counter (Space-Saving algorithm) with a fixed
+    number of slots. When the table is full, a new item takes the slot
+    of the smallest counter and inherits its count as error bound.
+    """
+
+    def __init__(self, capacity: int = 32) -> None:
+        """
+        Initialize an empty table.
+
+        === Args ===
+            capacity (int): Number of items tracked. Defaults to 32.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+    def add(self, item: str, count: int = 1) -> None:
+        """
+        Count one occurrence of an item.
+
+        === Args ===
+            item (str): The item seen.
+            count (int): Number of occurrences. Defaults to 1.
+        """
+        if item in self.counts:
+            self.counts[item] += count
+            return
+        if len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+            return
+
+        smallest = min(self.counts, key=self.counts.__getitem__)
+        floor = self.counts.pop(smallest)
+        del self.errors[smallest]
+        self.counts[item] = floor + count
+        self.errors[item] = floor
+
+    def top(self, n: int = 10) -> List[Tuple[str, int, int]]:
+        """
+        Return the most frequent items.
+
+        === Args ===
+            n (int): Number of items. Defaults to 10.
+
+        === Returns ===
+            List[Tuple[str, int, int]]: (item, estimated count, maximum
+            overestimation) tuples, most frequent first.
+        """
+        items = sorted(self.counts.items(), key=lambda pair: pair[1],
+                       reverse=True)[:n]
+        return [(item, count, self.errors[item]) for item, count in items]
+
+
+class HyperLogLog():
+    """
+    Distinct count estimator using 2**precision one-byte registers
+    (4 KiB and about 1.6% standard error with the default precision).
+    """
+
+    def __init__(self, precision: int = 12) -> None:
+        """
+        Initialize empty registers.
+
+        === Args ===
+            precision (int): Number of index bits, 4 to 16. Defaults to 12.
+        """
+        if not 4 <= precision <= 16:
+            raise ValueError("precision must be between 4 and 16")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, item: str) -> None:
+        """
+        Add an item to the estimator.
+
+        === Args ===
+            item (str): The item seen.
+        """
+        digest = hashlib.blake2b(item.encode(), digest_size=8).digest()
+        value = int.from_bytes(digest, "big")
+        bits = 64 - self.precision
+        index = value >> bits
+        rank = bits - (value & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self) -> int:
+        """
+        Estimate the number of distinct items added.
+
+        === Returns ===
+            int: The estimated cardinality.
+        """
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(2.0 ** -rank
+                                             for rank in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * size and zeros > 0:
+            estimate = size * math.log(size / zeros)
+        return round(estimate)
+
+
+class WindowAggregator():
+    """
+    Tumbling or sliding window aggregation of keyed metrics, by reading
+    count or by timestamp.
+
+    A window of `size` advancing by `slide` is split in panes of `slide`
+    units. Each pane only keeps a RunningStats per metric key, and a
+    window is the merge of its last size / slide panes, so raw readings
+    are never buffered.
+    """
+
+    def __init__(self, size: float, slide: Optional[float] = None,
+                 by: str = "count") -> None:
+        """
+        Initialize the aggregator.
+
+        === Args ===
+            size (float): Window length, in readings or in seconds.
+            slide (Optional[float]): Window step. Defaults to None
+            (tumbling window, slide == size).
+            by (str): 'count' or 'time'. Defaults to 'count'.
+        """
+        if by not in ("count", "time"):
+            raise ValueError("by must be 'count' or 'time'")
+        slide = size if slide is None else slide
+        if size <= 0 or slide <= 0 or slide > size:
+            raise ValueError("size and slide must be > 0 and slide <= size")
+        panes = size / slide
+        if not math.isclose(panes, round(panes)):
+            raise ValueError("size must be a multiple of slide")
+
+        self.size = size
+        self.slide = slide
+        self.by = by
+        self.panes: Deque[Dict[str, RunningStats]] = deque(
+            maxlen=round(panes))
+        self.current_pane: Optional[int] = None
+        self.current: Dict[str, RunningStats] = {}
+        self.position = 0
+        self.late_readings = 0
+
+    def add(self, key: str, value: float,
+            timestamp: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Add one reading and return the windows it closed.
+
+        === Args ===
+            key (str): The metric name (e.g. 'temp').
+            value (float): The reading.
+            timestamp (Optional[float]): Event time in seconds, required
+            for time windows. Defaults to None.
+
+        === Returns ===
+            List[Dict[str, Any]]: The closed windows (usually empty).
+        """
+        if self.by == "count":
+            point = self.position
+            self.position += 1
+        elif timestamp is None:
+            raise ValueError("time windows need a timestamp")
+        else:
+            point = timestamp
+
+        pane = int(point // self.slide)
+        closed = []
+        if self.current_pane is None:
+            self.current_pane = pane
+        elif pane > self.current_pane:
+            closed = self._advance(pane)
+        elif pane < self.current_pane:
+            # Its pane is closed: count it rather than corrupt a window
+            self.late_readings += 1
+            return closed
+
+        stats = self.current.get(key)
+        if stats is None:
+            stats = self.current[key] = RunningStats()
+        stats.add(value)
+        return closed
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """
+        Close the pane in progress and return the pending windows.
+
+        === Returns ===
+            List[Dict[str, Any]]: The windows closed by the flush.
+        """
+        if self.current_pane is None:
+            return []
+        return self._advance(self.current_pane + 1)
+
+    def _advance(self, pane: int) -> List[Dict[str, Any]]:
+        """
+        Close panes until `pane` becomes the current one.
+        """
+        closed = []
+        while self.current_pane < pane:
+            self.panes.append(self.current)
+            self.current = {}
+            if any(self.panes):
+                closed.append(self._window(self.current_pane))
+                self.current_pane += 1
+            else:
+                # Nothing left in any window: jump over the gap
+                self.current_pane = pane
+        return closed
+
+    def _window(self, last_pane: int) -> Dict[str, Any]:
+        """
+        Merge the stored panes into the window ending with last_pane.
+        """
+        metrics: Dict[str, RunningStats] = {}
+        for pane in self.panes:
+            for key, stats in pane.items():
+                if key not in metrics:
+                    metrics[key] = RunningStats()
+                metrics[key].merge(stats)
+
+        end = (last_pane + 1) * self.slide
+        return {"start": end - self.size, "end": end,
+                "metrics": {key: stats.as_dict()
+                            for key, stats in metrics.items()}}
+
+
 class SensorStream(DataStream):
     """
     Specialized stream handler for environmental sensor data.
     """
 
-    def __init__(self, stream_id: str) -> None:
+    HIGH_PRIORITY = field("temp", ">=", 30) | field("temp", "<=", 0)
+
+    def __init__(self, stream_id: str,
+                 window: Optional[WindowAggregator] = None) -> None:
         """
         Initialize a SensorStream with a fixed type 'Environmental Data'.
 
         === Args ===
             stream_id (str): The unique identifier for the sensor.
+            window (Optional[WindowAggregator]): Aggregator fed with every
+            valid reading of process_batch() and process_events(), its
+            closed windows kept in closed_windows (last 1024). Defaults
+            to None.
         """
         super().__init__(stream_id=stream_id, stream_type="Environmental Data")
+        self.window = window
+        self.closed_windows: Deque[Dict[str, Any]] = deque(maxlen=1024)
+        self.temperature = RunningStats()
+
+    @staticmethod
+    def parse_reading(reading: Any) -> Optional[Tuple[str, float]]:
+        """
+        Split a 'key:value' reading.
+
+        === Args ===
+            reading (Any): The raw reading (e.g., 'temp:22.5').
+
+        === Returns ===
+            Optional[Tuple[str, float]]: The metric key and value, or None
+            if the reading is invalid.
+        """
+        if not isinstance(reading, str):
+            return None
+        key, separator, value = reading.partition(":")
+        if not separator:
+            return None
+        try:
+            return key, float(value)
+        except ValueError:
+            return None
+
+    def aggregate(self, data_batch: List[Any],
+                  timestamp: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Feed a batch of readings to the window aggregator.
+
+        === Args ===
+            data_batch (List[Any]): 'key:value' strings, or
+            (timestamp, 'key:value') tuples for event-time windows.
+            timestamp (Optional[float]): Time used for plain readings.
+            Defaults to None (time of the call).
+
+        === Returns ===
+            List[Dict[str, Any]]: The windows closed by this batch.
+        """
+        if self.window is None:
+            raise ValueError(f"Stream {self.stream_id} has no window")
+        if timestamp is None:
+            timestamp = time.time()
+
+        self.state_version += 1
+        closed = []
+        for item in data_batch:
+            reading_time = timestamp
+            if isinstance(item, tuple):
+                reading_time, item = item
+            reading = self.parse_reading(item)
+            if reading is not None:
+                closed.extend(self.window.add(reading[0], reading[1],
+                                              reading_time))
+        return closed
+
+    def process_events(self, records: Iterable[Tuple[float, Any]],
+                       flush: bool = False) -> Optional[str]:
+        """
+        Same as DataStream.process_events(), the window being fed with
+        the event timestamps of the released readings, in timestamp
+        order. Only late records behind an earlier release can still
+        reach a time window out of order (counted in its late_readings).
+        """
+        released = self.release_events(records, flush=flush)
+        if not released:
+            return None
+        return self._process_readings([record for _, record in released],
+                                      [stamp for stamp, _ in released])
 
     def process_batch(self, data_batch: List[Any]) -> str:
         """
-        Process sensor data to extract temperature readings.
+        Process sensor data to average the temperature readings, and feed
+        them to the window if any (time windows use the time of the call).
 
         === Args ===
             data_batch (List[Any]): List of strings (e.g., 'temp:22.5').
@@ -92,39 +849,173 @@ class SensorStream(DataStream):
         === Returns ===
             str: Analysis string with the count and average temperature.
         """
-        temperature = None
+        return self._process_readings(data_batch)
 
-        for word in data_batch:
-            if word.startswith("temp"):
-                word_parts = word.split(":")
-                if len(word_parts) == 2:
-                    try:
-                        temperature = float(word_parts[1])
-                    except ValueError:
-                        pass
-                break
-
-        if temperature is not None:
+    def _process_readings(self, data_batch: List[Any],
+                          timestamps: Optional[List[float]] = None) -> str:
+        """
+        Shared body of process_batch() and process_events(), timestamps
+        being the event time of each reading (None: time of the call).
+        """
+        start = time.perf_counter()
+        temperatures = RunningStats()
+        errors = 0
+        if timestamps is None:
+            timestamps = [time.time()] * len(data_batch)
+
+        for word, timestamp in zip(data_batch, timestamps):
+            reading = self.parse_reading(word)
+            if reading is None:
+                errors += 1
+                continue
+            if reading[0] == "temp":
+                temperatures.add(reading[1])
+            if self.window is not None:
+                self.closed_windows.extend(
+                    self.window.add(reading[0], reading[1], timestamp))
+
+        self.temperature.merge(temperatures)
+        self.update_stats(len(data_batch), errors,
+                          time.perf_counter() - start)
+
+        if temperatures.count > 0:
+            temperature = round(temperatures.mean, 2)
             return (f"Sensor analysis: {len(data_batch)} readings processed, "
                     f"avg temp: {temperature}°C")
         else:
             return (f"Sensor analysis: {len(data_batch)} readings processed, "
                     f"avg temp: data not found")
 
+    def get_stats(self) -> Dict[str, Union[str, int, float]]:
+        """
+        Add the running temperature average to the stream statistics.
+        """
+        stat = super().get_stats()
+        if self.temperature.count > 0:
+            stat["avg_temp"] = self.temperature.mean
+        return stat
+
 
 class TransactionStream(DataStream):
     """
     Specialized stream handler for transaction data.
+
+    Amounts are kept as integers in 1 / 10**decimals units (cents by
+    default), so the net flow never drifts like a float sum would.
     """
 
-    def __init__(self, stream_id: str) -> None:
+    HIGH_PRIORITY = field(None, ">=", 100)
+
+    # Operation -> sign applied to the amount
+    OPERATIONS: Dict[str, int] = {"buy": 1, "sell": -1}
+
+    def __init__(self, stream_id: str, decimals: int = 2) -> None:
         """
         Initialize a TransactionStream with a fixed type 'Financial Data'.
 
         === Args ===
             stream_id (str): The unique identifier for the sensor.
+            decimals (int): Number of decimals kept on amounts.
+            Defaults to 2.
         """
         super().__init__(stream_id=stream_id, stream_type="Financial Data")
+        self.decimals = decimals
+        self.scale = 10 ** decimals
+        self.operations = 0
+        self.net_units = 0
+        self.operation_counts: Dict[str, int] = {}
+        self.operation_volumes: Dict[str, int] = {}
+
+    def parse_amount(self, amount: str) -> Optional[int]:
+        """
+        Convert a decimal string to an integer number of units, exactly.
+
+        === Args ===
+            amount (str): The amount (e.g., '100', '-12.5').
+
+        === Returns ===
+            Optional[int]: The amount in 1 / 10**decimals units, or None if
+            it is not a number or has too many decimals.
+        """
+        amount = amount.strip()
+        # str.isdigit() also accepts digits int() rejects (e.g. '²')
+        if not amount.isascii():
+            return None
+        negative = amount.startswith("-")
+        if negative or amount.startswith("+"):
+            amount = amount[1:]
+
+        whole, _, fraction = amount.partition(".")
+        if not (whole.isdigit() or (whole == "" and fraction)):
+            return None
+        if fraction and not fraction.isdigit():
+            return None
+        if len(fraction) > self.decimals:
+            return None
+
+        units = (int(whole or "0") * self.scale
+                 + int(fraction.ljust(self.decimals, "0") or "0"))
+        return -units if negative else units
+
+    def to_amount(self, units: int) -> Decimal:
+        """
+        Convert integer units back to an exact decimal amount.
+
+        === Args ===
+            units (int): The amount in 1 / 10**decimals units.
+
+        === Returns ===
+            Decimal: The amount.
+        """
+        return Decimal(units).scaleb(-self.decimals)
+
+    def analyze(self, data_batch: List[Any]) -> Dict[str, Any]:
+        """
+        Parse a batch in a single pass and update the cumulative state.
+
+        === Args ===
+            data_batch (List[Any]): List of strings (e.g., 'buy:100').
+
+        === Returns ===
+            Dict[str, Any]: 'operations', 'errors', 'net_units' and, per
+            operation, 'counts' and 'volumes' (in units).
+        """
+        start = time.perf_counter()
+        signs = self.OPERATIONS
+        parse_amount = self.parse_amount
+        counts: Dict[str, int] = {}
+        volumes: Dict[str, int] = {}
+        net = 0
+        valid_operation = 0
+
+        for word in data_batch:
+            if not isinstance(word, str):
+                continue
+            operation, _, amount = word.partition(":")
+            sign = signs.get(operation)
+            if sign is None:
+                continue
+            units = parse_amount(amount)
+            if units is None:
+                continue
+            valid_operation += 1
+            net += sign * units
+            counts[operation] = counts.get(operation, 0) + 1
+            volumes[operation] = volumes.get(operation, 0) + units
+
+        self.operations += valid_operation
+        self.net_units += net
+        for operation, count in counts.items():
+            self.operation_counts[operation] = (
+                self.operation_counts.get(operation, 0) + count)
+            self.operation_volumes[operation] = (
+                self.operation_volumes.get(operation, 0) + volumes[operation])
+        self.update_stats(len(data_batch), len(data_batch) - valid_operation,
+                          time.perf_counter() - start)
+
+        return {"operations": valid_operation,
+                "errors": len(data_batch) - valid_operation,
+                "net_units": net, "counts": counts, "volumes": volumes}
 
     def process_batch(self, data_batch: List[Any]) -> str:
         """
@@ -136,49 +1027,66 @@ class TransactionStream(DataStream):
         === Returns ===
             str: Analysis string with the operations and the net flow.
         """
-
-        total = 0
-        operations = ["buy", "sell"]
-        valid_operation = 0
-
         if len(data_batch) == 0:
+            self.update_stats(0, 0, 0.0)
             return "Transaction analysis: 0 operations, net flow: +0 unit"
 
-        for word in data_batch:
-            word_parts = word.split(":")
-            if len(word_parts) == 2:
-                if word_parts[0] in operations:
-                    valid_operation += 1
-                try:
-                    if word_parts[0] == "buy":
-                        total += float(word_parts[1])
-                    elif word_parts[0] == "sell":
-                        total -= float(word_parts[1])
-                except ValueError:
-                    valid_operation -= 1
+        result = self.analyze(data_batch)
+        total = self.to_amount(result["net_units"])
 
         if total >= 0:
             sign = "+"
         else:
             sign = ""
 
-        return (f"Transaction analysis: {valid_operation} operations, net "
-                f"flow: {sign}{total:.0f} units")
+        return (f"Transaction analysis: {result['operations']} operations, "
+                f"net flow: {sign}{total:.0f} units")
+
+    def get_stats(self) -> Dict[str, Union[str, int, float]]:
+        """
+        Add the cumulative operations, net flow and per-operation counts
+        and volumes to the statistics.
+        """
+        stat = super().get_stats()
+        stat["operations"] = self.operations
+        stat["net_flow"] = str(self.to_amount(self.net_units))
+        for operation, count in self.operation_counts.items():
+            stat[f"{operation}_count"] = count
+            stat[f"{operation}_volume"] = str(
+                self.to_amount(self.operation_volumes[operation]))
+        return stat
 
 
 class EventStream(DataStream):
     """
     Specialized stream handler for event data.
+
+    Known event types get exact counters. Unknown types are tracked in
+    fixed memory: a Space-Saving table for the most frequent ones and a
+    HyperLogLog for the number of distinct types.
     """
 
-    def __init__(self, stream_id: str) -> None:
+    EVENT_TYPES = ("login", "error", "logout", "warn", "info")
+
+    HIGH_PRIORITY = one_of("error", "warn")
+
+    def __init__(self, stream_id: str, top_k: int = 32,
+                 precision: int = 12) -> None:
         """
         Initialize a EventStream with a fixed type 'System Events'.
 
         === Args ===
             stream_id (str): The unique identifier for the sensor.
+            top_k (int): Unknown event types tracked. Defaults to 32.
+            precision (int): HyperLogLog precision. Defaults to 12.
         """
         super().__init__(stream_id=stream_id, stream_type="System Events")
+        self.events = 0
+        self.error_events = 0
+        self.event_counts: Dict[str, int] = dict.fromkeys(self.EVENT_TYPES,
+                                                          0)
+        self.unknown_events = SpaceSaving(capacity=top_k)
+        self.distinct_events = HyperLogLog(precision=precision)
 
     def process_batch(self, data_batch: List[Any]) -> str:
         """
@@ -191,15 +1099,26 @@ class EventStream(DataStream):
             str: Analysis string with number of events and error.
         """
 
-        event_type = ["login", "error", "logout", "warn", "info"]
+        start = time.perf_counter()
+        counts = self.event_counts
         event_count = 0
         error_count = 0
 
         for event in data_batch:
-            if event in event_type:
+            event = str(event)
+            if event in counts:
+                counts[event] += 1
                 event_count += 1
-            if event == "error":
-                error_count += 1
+                if event == "error":
+                    error_count += 1
+            else:
+                self.unknown_events.add(event)
+            self.distinct_events.add(event)
+
+        self.events += event_count
+        self.error_events += error_count
+        self.update_stats(len(data_batch), len(data_batch) - event_count,
+                          time.perf_counter() - start)
 
         if error_count == 1:
             return (f"Event analysis: {event_count} events, {error_count}"
@@ -210,44 +1129,422 @@ class EventStream(DataStream):
         else:
             return (f"Event analysis: {event_count} events, no error detected")
 
+    def get_stats(self) -> Dict[str, Union[str, int, float]]:
+        """
+        Add the cumulative event and error event counts to the statistics.
+        """
+        stat = super().get_stats()
+        stat["events"] = self.events
+        stat["error_events"] = self.error_events
+        stat["distinct_events"] = self.distinct_events.count()
+        for event, count in self.event_counts.items():
+            stat[f"{event}_count"] = count
+        return stat
+
+    def top_unknown(self, n: int = 10) -> List[Tuple[str, int, int]]:
+        """
+        Most frequent unknown event types seen so far.
+
+        === Args ===
+            n (int): Number of event types. Defaults to 10.
+
+        === Returns ===
+            List[Tuple[str, int, int]]: See SpaceSaving.top().
+        """
+        return self.unknown_events.top(n)
+
 
 class StreamProcessor():
     """
     Manager class to handle multiple DataStream instances polymorphically.
     """
 
-    def __init__(self):
+    # Characters that make a routing key a wildcard pattern
+    PATTERN_CHARS = frozenset("*?[")
+    # Pattern results kept by route(), the oldest are evicted first
+    PATTERN_CACHE_SIZE = 256
+
+    def __init__(self, queue_size: int = 100) -> None:
         """
-        Initialize the StreamProcessor with an empty list of streams.
+        Initialize the StreamProcessor with an empty stream registry.
+
+        === Args ===
+            queue_size (int): Default number of batches waiting per
+            stream in asyncio mode before producers are blocked.
+            Defaults to 100.
         """
-        self.streams = []
+        self.streams: Dict[str, DataStream] = {}
+        self.streams_by_type: Dict[str, Dict[str, DataStream]] = {}
+        self.pattern_cache: Dict[str, List[DataStream]] = {}
+        self.batch_count = 0
+        self.queue_size = queue_size
+        self.queue_sizes: Dict[str, int] = {}
+        self.queues: Dict[str, asyncio.Queue] = {}
+        self.consumers: Dict[str, asyncio.Task] = {}
+        self.results: Dict[str, List[str]] = {}
+        self.on_result: Optional[Callable[[str, str], None]] = None
+        self.checkpoint_path: Optional[str] = None
+        self.checkpoint_interval = 60.0
+        self.last_checkpoint = 0.0
+        self.checkpoint_blobs: Dict[str, Tuple[Tuple[Any, ...], bytes]] = {}
 
     def add_streams(self, stream: DataStream) -> None:
         """
-        Add a DataStream object to the processor's list.
+        Register a DataStream object by its ID.
 
         === Args ===
             stream (DataStream): The stream instance to add.
         """
-        self.streams.append(stream)
+        if stream.stream_id in self.streams:
+            raise ValueError(f"Stream {stream.stream_id} already registered")
+        self.streams[stream.stream_id] = stream
+        self.streams_by_type.setdefault(
+            stream.stream_type, {})[stream.stream_id] = stream
+        self.pattern_cache.clear()
+        self.checkpoint_blobs.pop(stream.stream_id, None)
+
+    def remove_stream(self, stream_id: str) -> DataStream:
+        """
+        Unregister a stream.
+
+        === Args ===
+            stream_id (str): The ID of the stream to remove.
+
+        === Returns ===
+            DataStream: The removed stream.
+        """
+        stream = self.streams.pop(stream_id)
+        same_type = self.streams_by_type[stream.stream_type]
+        del same_type[stream_id]
+        if not same_type:
+            del self.streams_by_type[stream.stream_type]
+        self.pattern_cache.clear()
+        self.checkpoint_blobs.pop(stream_id, None)
+        return stream
+
+    def route(self, key: str) -> List[DataStream]:
+        """
+        Find the streams targeted by a routing key: a stream ID, a stream
+        type, or a wildcard pattern on IDs (e.g., 'SENSOR_*'). IDs and
+        types are dictionary lookups, pattern results are cached until
+        the registry changes. Any other key matches nothing.
 
-    def process(self, batch_data: Dict[str, List[any]]) -> None:
+        === Args ===
+            key (str): The routing key.
+
+        === Returns ===
+            List[DataStream]: The matching streams (may be empty).
         """
-        Process a batch of mixed data types for all registered streams.
+        stream = self.streams.get(key)
+        if stream is not None:
+            return [stream]
+
+        same_type = self.streams_by_type.get(key)
+        if same_type is not None:
+            return list(same_type.values())
+
+        if self.PATTERN_CHARS.isdisjoint(key):
+            return []
+
+        matches = self.pattern_cache.get(key)
+        if matches is None:
+            matches = [self.streams[stream_id] for stream_id
+                       in fnmatch.filter(self.streams, key)]
+            if len(self.pattern_cache) >= self.PATTERN_CACHE_SIZE:
+                del self.pattern_cache[next(iter(self.pattern_cache))]
+            self.pattern_cache[key] = matches
+        return matches
+
+    def route_records(self, records: Iterable[Tuple[str, Any]]
+                      ) -> Dict[str, List[Any]]:
+        """
+        Group (routing key, record) pairs into one batch per stream ID.
 
         === Args ===
-            batch_data (Dict[str, List[any]]): Dictionary where keys are
-            the stream ID and values are list of data to process.
+            records (Iterable[Tuple[str, Any]]): The incoming records.
+
+        === Returns ===
+            Dict[str, List[Any]]: Batches keyed by stream ID, ready for
+            process().
+        """
+        batches: Dict[str, List[Any]] = {}
+        for key, record in records:
+            for stream in self.route(key):
+                batch = batches.get(stream.stream_id)
+                if batch is None:
+                    batch = batches[stream.stream_id] = []
+                batch.append(record)
+        return batches
+
+    def process(self, batch_data: Dict[str, List[Any]],
+                report_missing: bool = True) -> None:
         """
-        print("Batch 1 Results:")
+        Process a batch of mixed data types for all registered streams.
 
-        for stream in self.streams:
-            stream_data = batch_data.get(stream.stream_id)
-            if stream_data is not None:
+        === Args ===
+            batch_data (Dict[str, List[Any]]): Dictionary where keys are
+            routing keys (stream ID, stream type or pattern) and values
+            are list of data to process.
+            report_missing (bool): Also list the registered streams that
+            got no data. Defaults to True.
+        """
+        self.batch_count += 1
+        print(f"Batch {self.batch_count} Results:")
+
+        served = set()
+        for key, stream_data in batch_data.items():
+            streams = self.route(key)
+            if not streams:
+                print(f"- No stream registered for {key}")
+            for stream in streams:
+                served.add(stream.stream_id)
                 result = stream.process_batch(stream_data)
                 print(f"- {result}")
+
+        if report_missing and len(served) < len(self.streams):
+            for stream_id in self.streams:
+                if stream_id not in served:
+                    print(f"- No data found for stream {stream_id}")
+
+        self.maybe_checkpoint()
+
+    def enable_checkpoints(self, path: str, interval: float = 60.0) -> None:
+        """
+        Checkpoint the streams to `path` every `interval` seconds while
+        batches are processed (see maybe_checkpoint()).
+
+        === Args ===
+            path (str): The checkpoint file.
+            interval (float): Seconds between checkpoints. Defaults to 60.
+        """
+        self.checkpoint_path = path
+        self.checkpoint_interval = interval
+        self.last_checkpoint = time.monotonic()
+
+    def maybe_checkpoint(self) -> bool:
+        """
+        Write a checkpoint if one is due.
+
+        === Returns ===
+            bool: True if a checkpoint was written.
+        """
+        if self.checkpoint_path is None:
+            return False
+        if time.monotonic() - self.last_checkpoint < self.checkpoint_interval:
+            return False
+        self.checkpoint(self.checkpoint_path)
+        return True
+
+    def checkpoint(self, path: str) -> int:
+        """
+        Save the state of every stream to a binary file. Only the streams
+        whose state signature changed since the previous checkpoint are
+        serialized again (see DataStream.state_signature()). The file is
+        written next to `path` and renamed over it, so a crash never
+        leaves a half-written checkpoint.
+
+        === Args ===
+            path (str): The checkpoint file.
+
+        === Returns ===
+            int: Number of streams serialized again.
+        """
+        refreshed = 0
+        blobs = {}
+        for stream_id, stream in self.streams.items():
+            cached = self.checkpoint_blobs.get(stream_id)
+            signature = stream.state_signature()
+            if cached is None or cached[0] != signature:
+                cached = (signature,
+                          pickle.dumps(stream.get_state(),
+                                       protocol=pickle.HIGHEST_PROTOCOL))
+                refreshed += 1
+            blobs[stream_id] = cached
+        self.checkpoint_blobs = blobs
+
+        payload = {"version": 1,
+                   "streams": {stream_id: blob for stream_id, (_, blob)
+                               in blobs.items()}}
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory,
+                                                 suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+        self.last_checkpoint = time.monotonic()
+        return refreshed
+
+    def restore(self, path: str) -> List[str]:
+        """
+        Load a checkpoint into the registered streams. Streams must be
+        registered (with the same IDs) before restoring; unknown IDs in
+        the file are ignored. Only load checkpoints written by this
+        program: they are pickle files.
+
+        === Args ===
+            path (str): The checkpoint file.
+
+        === Returns ===
+            List[str]: IDs of the restored streams (empty if the file does
+            not exist).
+        """
+        if not os.path.exists(path):
+            return []
+        with open(path, "rb") as file:
+            payload = pickle.load(file)
+        if payload.get("version") != 1:
+            raise ValueError(f"Unsupported checkpoint version in {path}")
+
+        restored = []
+        for stream_id, blob in payload["streams"].items():
+            stream = self.streams.get(stream_id)
+            if stream is None:
+                continue
+            stream.set_state(pickle.loads(blob))
+            self.checkpoint_blobs[stream_id] = (stream.state_signature(),
+                                                blob)
+            restored.append(stream_id)
+        return restored
+
+    def set_queue_size(self, stream_id: str, size: int) -> None:
+        """
+        Override the asyncio queue limit of one stream (before start()).
+
+        === Args ===
+            stream_id (str): The stream to configure.
+            size (int): Maximum batches waiting for this stream.
+        """
+        self.queue_sizes[stream_id] = size
+
+    async def start(self) -> None:
+        """
+        Create one bounded asyncio.Queue and one consumer task per stream.
+        """
+        for stream in self.streams.values():
+            size = self.queue_sizes.get(stream.stream_id, self.queue_size)
+            queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+            self.queues[stream.stream_id] = queue
+            self.results.setdefault(stream.stream_id, [])
+            self.consumers[stream.stream_id] = asyncio.create_task(
+                self._consume(stream, queue))
+
+    async def submit(self, stream_id: str, data_batch: List[Any]) -> None:
+        """
+        Queue a batch for a stream. Waits while the stream's queue is
+        full, which slows a fast producer down to its consumer's pace
+        without blocking the other streams. If the stream's consumer has
+        failed, its exception is raised here instead of waiting forever.
+
+        === Args ===
+            stream_id (str): The target stream.
+            data_batch (List[Any]): The batch to process.
+        """
+        if stream_id not in self.queues:
+            raise KeyError(f"No stream registered with id {stream_id}")
+        await self._put(stream_id, data_batch)
+
+    async def _put(self, stream_id: str, item: Any) -> None:
+        """Put into a stream's queue unless (or until) its consumer ends."""
+        queue = self.queues[stream_id]
+        consumer = self.consumers[stream_id]
+        if not consumer.done() and not queue.full():
+            queue.put_nowait(item)
+            return
+
+        putter = asyncio.ensure_future(queue.put(item))
+        await asyncio.wait({putter, consumer},
+                           return_when=asyncio.FIRST_COMPLETED)
+        if putter.done():
+            return
+        putter.cancel()
+        consumer.result()
+        raise RuntimeError(f"Consumer of stream {stream_id} has stopped")
+
+    async def stop(self) -> Dict[str, List[str]]:
+        """
+        Wait for every queued batch to be processed and stop consumers.
+        If a consumer failed, the others are cancelled and its exception
+        is raised.
+
+        === Returns ===
+            Dict[str, List[str]]: The results collected per stream (empty
+            lists when on_result is set).
+        """
+        try:
+            for stream_id in self.queues:
+                await self._put(stream_id, None)
+            await asyncio.gather(*self.consumers.values())
+        except BaseException:
+            await self._cancel(list(self.consumers.values()))
+            raise
+        finally:
+            self.consumers = {}
+            self.queues = {}
+        return self.results
+
+    @staticmethod
+    async def _cancel(tasks: List[asyncio.Task]) -> None:
+        """Cancel tasks and wait until they are all finished."""
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(self, feeds: Dict[str, AsyncIterable[List[Any]]]
+                  ) -> Dict[str, List[str]]:
+        """
+        Consume one async feed of batches per stream until all are done.
+
+        === Args ===
+            feeds (Dict[str, AsyncIterable[List[Any]]]): Async iterables
+            of batches, keyed by stream ID.
+
+        === Returns ===
+            Dict[str, List[str]]: The results collected per stream.
+        """
+        await self.start()
+
+        async def produce(stream_id: str,
+                          feed: AsyncIterable[List[Any]]) -> None:
+            async for data_batch in feed:
+                await self.submit(stream_id, data_batch)
+
+        # A failing producer or consumer cancels every other task
+        producers = [asyncio.ensure_future(produce(stream_id, feed))
+                     for stream_id, feed in feeds.items()]
+        try:
+            await asyncio.gather(*producers)
+        except BaseException:
+            await self._cancel(producers)
+            await self._cancel(list(self.consumers.values()))
+            self.consumers = {}
+            self.queues = {}
+            raise
+        return await self.stop()
+
+    async def _consume(self, stream: DataStream,
+                       queue: asyncio.Queue) -> None:
+        """
+        Process the batches of one stream until the stop marker.
+        """
+        while True:
+            data_batch = await queue.get()
+            if data_batch is None:
+                return
+            result = stream.process_batch(data_batch)
+            if self.on_result is not None:
+                self.on_result(stream.stream_id, result)
             else:
-                print(f"- No data found for stream {stream.stream_id}")
+                self.results[stream.stream_id].append(result)
+            self.maybe_checkpoint()
+            # Let the other streams' consumers run between batches
+            await asyncio.sleep(0)
 
 
 def error_tester(tester: str) -> None:
@@ -486,8 +1783,8 @@ def main() -> None:
     crit_sensors = processor_sensor.filter_data(batch_data["SENSOR_001"])
     large_trans = processor_transaction.filter_data(batch_data["TRANS_001"],
                                                     criteria="150")
-    print(f"Filtered results: {len(crit_sensors)} critical sensor alerts, "
-          f"{len(large_trans)} large transaction")
+    print(f"Filtered results: {sum(1 for _ in crit_sensors)} critical "
+          f"sensor alerts, {sum(1 for _ in large_trans)} large transaction")
 
     print("\nAll streams processed successfully. Nexus throughput optimal.")
 
@@ -1,11 +1,27 @@
+import bisect
+import csv
+import json
+import multiprocessing
+import pickle
 import random
+import tempfile
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections import deque
+from queue import Empty, Full
 from typing import Any, List, Dict, Union, Optional, Protocol  # noqa: F401
+from typing import Callable, Iterable, Iterator, Tuple
 
 
 class ProcessingStage(Protocol):
-    """Interface for stages using duck typing."""
+    """
+    Interface for stages using duck typing.
+
+    A stage may also define process_batch(batch, verbose) -> list to
+    handle a whole micro-batch at once (see ProcessingPipeline.stream()),
+    returning one result per record, None for the rejected ones.
+    """
 
     def process(self, data: Any, verbose: bool = True) -> Any:
         """
@@ -21,6 +37,368 @@ class ProcessingStage(Protocol):
         pass
 
 
+class LatencyHistogram():
+    """
+    Fixed-bucket latency histogram in nanoseconds. Bucket bounds grow by
+    2 ** 0.25 (about 19%) from 100ns to about 2 minutes, so recording is
+    a bisect and percentiles are accurate to one bucket.
+    """
+
+    BOUNDS: List[int] = [int(100 * 2 ** (i / 4)) for i in range(122)]
+
+    def __init__(self) -> None:
+        """Initialize empty buckets (the last one is unbounded)."""
+        self.buckets = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total_ns = 0
+
+    def record(self, elapsed_ns: int, count: int = 1) -> None:
+        """
+        Add one measurement, or `count` identical ones.
+
+        === Args ===
+            - elapsed_ns (int): The latency in nanoseconds.
+            - count (int), default to 1: Number of measurements.
+        """
+        self.buckets[bisect.bisect_left(self.BOUNDS, elapsed_ns)] += count
+        self.count += count
+        self.total_ns += elapsed_ns * count
+
+    def percentile(self, quantile: float) -> int:
+        """
+        Estimate a percentile.
+
+        === Args ===
+            - quantile (float): Between 0 and 1 (0.99 for p99).
+
+        === Returns ===
+            - int: Upper bound of the matching bucket, in nanoseconds
+            (0 when empty).
+        """
+        if self.count == 0:
+            return 0
+        target = quantile * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= target and bucket:
+                if index < len(self.BOUNDS):
+                    return self.BOUNDS[index]
+                return self.BOUNDS[-1]
+        return self.BOUNDS[-1]
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the measurements of another histogram to this one."""
+        self.buckets = [mine + theirs for mine, theirs
+                        in zip(self.buckets, other.buckets)]
+        self.count += other.count
+        self.total_ns += other.total_ns
+
+    def as_dict(self) -> Dict[str, int]:
+        """Export count, sum and p50/p95/p99 in nanoseconds."""
+        return {"count": self.count, "sum_ns": self.total_ns,
+                "p50_ns": self.percentile(0.50),
+                "p95_ns": self.percentile(0.95),
+                "p99_ns": self.percentile(0.99)}
+
+
+def record_size(record: Any) -> int:
+    """
+    Approximate size of a record in bytes (length of its text form).
+
+    === Args ===
+        - record (Any): The record.
+
+    === Returns ===
+        - int: The size, 0 for None.
+    """
+    if record is None:
+        return 0
+    if isinstance(record, (bytes, bytearray)):
+        return len(record)
+    if isinstance(record, str):
+        return len(record.encode())
+    return len(json.dumps(record, default=str).encode())
+
+
+class StageMetrics():
+    """Counters and latency histogram of one stage (or one pipeline)."""
+
+    def __init__(self, name: str, measure_bytes: bool = False) -> None:
+        """
+        Initialize empty metrics.
+
+        === Args ===
+            - name (str): Stage label.
+            - measure_bytes (bool), default to False: Also measure the
+            record sizes (costs one serialization per record).
+        """
+        self.name = name
+        self.measure_bytes = measure_bytes
+        self.records_in = 0
+        self.records_out = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.latency = LatencyHistogram()
+
+    def observe(self, record_in: Any, record_out: Any,
+                elapsed_ns: int) -> None:
+        """
+        Account for one processed record.
+
+        === Args ===
+            - record_in (Any): The record given to the stage.
+            - record_out (Any): What the stage returned (None if dropped).
+            - elapsed_ns (int): Time spent in the stage.
+        """
+        self.records_in += 1
+        if record_out is not None:
+            self.records_out += 1
+        if self.measure_bytes:
+            self.bytes_in += record_size(record_in)
+            self.bytes_out += record_size(record_out)
+        self.latency.record(elapsed_ns)
+
+    def observe_batch(self, batch_in: List[Any], batch_out: List[Any],
+                      elapsed_ns: int) -> None:
+        """
+        Account for one micro-batch; every record is given the average
+        latency of the batch.
+
+        === Args ===
+            - batch_in (List[Any]): The records given to the stage.
+            - batch_out (List[Any]): The records kept by the stage.
+            - elapsed_ns (int): Time spent on the whole batch.
+        """
+        if not batch_in:
+            return
+        self.records_in += len(batch_in)
+        self.records_out += len(batch_out)
+        if self.measure_bytes:
+            self.bytes_in += sum(map(record_size, batch_in))
+            self.bytes_out += sum(map(record_size, batch_out))
+        self.latency.record(elapsed_ns // len(batch_in), len(batch_in))
+
+    def merge(self, other: "StageMetrics") -> None:
+        """Add the counters and latencies of another StageMetrics."""
+        self.records_in += other.records_in
+        self.records_out += other.records_out
+        self.bytes_in += other.bytes_in
+        self.bytes_out += other.bytes_out
+        self.latency.merge(other.latency)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Export the metrics as a dictionary."""
+        return {"records_in": self.records_in,
+                "records_out": self.records_out,
+                "bytes_in": self.bytes_in, "bytes_out": self.bytes_out,
+                "latency": self.latency.as_dict()}
+
+
+class PipelineMetrics():
+    """Per-stage and whole-pipeline metrics of a ProcessingPipeline."""
+
+    def __init__(self, pipeline_id: Optional[str],
+                 measure_bytes: bool = False) -> None:
+        """
+        Initialize empty metrics.
+
+        === Args ===
+            - pipeline_id (Optional[str]): The pipeline label.
+            - measure_bytes (bool), default to False: Measure record sizes.
+        """
+        self.pipeline_id = pipeline_id
+        self.measure_bytes = measure_bytes
+        self.total = StageMetrics("pipeline", measure_bytes)
+        self.stages: List[Optional[StageMetrics]] = []
+
+    def stage(self, index: int, stage: ProcessingStage) -> StageMetrics:
+        """
+        Get (or create) the metrics of the stage at `index`.
+
+        === Args ===
+            - index (int): Position of the stage in the pipeline.
+            - stage (ProcessingStage): The stage, used for its name.
+
+        === Returns ===
+            - StageMetrics: The stage metrics.
+        """
+        while len(self.stages) <= index:
+            self.stages.append(None)
+        if self.stages[index] is None:
+            self.stages[index] = StageMetrics(
+                f"{index}:{type(stage).__name__}", self.measure_bytes)
+        return self.stages[index]
+
+    def merge(self, other: "PipelineMetrics") -> None:
+        """
+        Add the metrics of another run of the same pipeline, e.g. the copy
+        kept by a worker process.
+
+        === Args ===
+            - other (PipelineMetrics): The metrics to add.
+        """
+        self.total.merge(other.total)
+        while len(self.stages) < len(other.stages):
+            self.stages.append(None)
+        for index, metrics in enumerate(other.stages):
+            if metrics is None:
+                continue
+            if self.stages[index] is None:
+                self.stages[index] = StageMetrics(metrics.name,
+                                                  self.measure_bytes)
+            self.stages[index].merge(metrics)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Export the pipeline and stage metrics as a dictionary."""
+        return {"pipeline": self.total.as_dict(),
+                "stages": {metrics.name: metrics.as_dict()
+                           for metrics in self.stages if metrics}}
+
+    def prometheus_samples(self) -> Dict[str, List[str]]:
+        """
+        Build the Prometheus sample lines of this pipeline, grouped by
+        metric family (see format_prometheus()).
+        """
+        families: Dict[str, List[str]] = {name: [] for name
+                                          in PROMETHEUS_TYPES}
+        entries = [self.total] + [metrics for metrics in self.stages
+                                  if metrics]
+        for metrics in entries:
+            labels = f'pipeline="{self.pipeline_id}",stage="{metrics.name}"'
+            for family, value in (
+                    ("nexus_records_in_total", metrics.records_in),
+                    ("nexus_records_out_total", metrics.records_out),
+                    ("nexus_bytes_in_total", metrics.bytes_in),
+                    ("nexus_bytes_out_total", metrics.bytes_out)):
+                families[family].append(f"{family}{{{labels}}} {value}")
+
+            histogram = metrics.latency
+            samples = families["nexus_latency_seconds"]
+            cumulative = 0
+            for bound, bucket in zip(histogram.BOUNDS, histogram.buckets):
+                cumulative += bucket
+                if bucket:
+                    samples.append(f"nexus_latency_seconds_bucket{{{labels},"
+                                   f'le="{bound / 1e9:.9f}"}} {cumulative}')
+            samples.append(f"nexus_latency_seconds_bucket{{{labels},"
+                           f'le="+Inf"}} {histogram.count}')
+            samples.append(f"nexus_latency_seconds_sum{{{labels}}} "
+                           f"{histogram.total_ns / 1e9:.9f}")
+            samples.append(f"nexus_latency_seconds_count{{{labels}}} "
+                           f"{histogram.count}")
+        return families
+
+    def to_prometheus(self) -> str:
+        """Export the metrics in the Prometheus text exposition format."""
+        return format_prometheus([self.prometheus_samples()])
+
+
+PROMETHEUS_TYPES: Dict[str, str] = {
+    "nexus_records_in_total": "counter",
+    "nexus_records_out_total": "counter",
+    "nexus_bytes_in_total": "counter",
+    "nexus_bytes_out_total": "counter",
+    "nexus_latency_seconds": "histogram",
+    "nexus_queue_depth": "gauge",
+    "nexus_buffer_dropped_total": "counter",
+    "nexus_buffer_spilled_total": "counter",
+    "nexus_retries_total": "counter",
+    "nexus_failovers_total": "counter",
+    "nexus_dead_letters_total": "counter",
+}
+
+
+def format_prometheus(sources: List[Dict[str, List[str]]]) -> str:
+    """
+    Merge sample lines by metric family, each family under its # TYPE
+    header as the exposition format requires.
+
+    === Args ===
+        - sources (List[Dict[str, List[str]]]): Samples per family.
+
+    === Returns ===
+        - str: The exposition text.
+    """
+    lines = []
+    for family, kind in PROMETHEUS_TYPES.items():
+        samples = [line for source in sources
+                   for line in source.get(family, [])]
+        if samples:
+            lines.append(f"# TYPE {family} {kind}")
+            lines.extend(samples)
+    return "\n".join(lines) + "\n"
+
+
+class DeadLetterFile():
+    """Dead-letter sink appending every entry to a JSON lines file."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Initialize the sink.
+
+        === Args ===
+            - path (str): The file to append to.
+        """
+        self.path = path
+
+    def __call__(self, entry: Dict[str, Any]) -> None:
+        """Write one entry; records that are not JSON are stored as repr."""
+        with open(self.path, "a") as file:
+            file.write(json.dumps(entry, default=repr) + "\n")
+
+
+class RecoveryPolicy():
+    """
+    Per-record error handling of a pipeline: how often a failing stage is
+    retried, and where records that still fail end up.
+    """
+
+    def __init__(self, retries: int = 2, backoff: float = 0.01,
+                 max_backoff: float = 1.0,
+                 dead_letter: Optional[Callable[[Dict[str, Any]],
+                                                None]] = None,
+                 max_dead_letters: int = 1000) -> None:
+        """
+        Initialize the policy.
+
+        === Args ===
+            - retries (int), default to 2: Extra attempts for a stage that
+            raised.
+            - backoff (float), default to 0.01: Seconds before the first
+            retry, doubled at every attempt.
+            - max_backoff (float), default to 1.0: Upper bound of the wait.
+            - dead_letter (Optional[Callable]), default to None: Sink
+            called with every dead-lettered entry (see DeadLetterFile).
+            - max_dead_letters (int), default to 1000: Entries kept in
+            memory, the oldest are discarded first.
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.dead_letter_sink = dead_letter
+        self.dead_letters: deque = deque(maxlen=max_dead_letters)
+        self.retried = 0
+        self.failovers = 0
+        self.dead_lettered = 0
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number `attempt` (from 0)."""
+        return min(self.backoff * 2 ** attempt, self.max_backoff)
+
+    def dead_letter(self, entry: Dict[str, Any]) -> None:
+        """Keep a failed record and hand it to the sink."""
+        self.dead_lettered += 1
+        self.dead_letters.append(entry)
+        if self.dead_letter_sink is not None:
+            self.dead_letter_sink(entry)
+
+    def as_dict(self) -> Dict[str, int]:
+        """Export the counters as a dictionary."""
+        return {"retried": self.retried, "failovers": self.failovers,
+                "dead_lettered": self.dead_lettered}
+
+
 class ProcessingPipeline(ABC):
     """
     Abstract base class defining the structure for data processing pipelines.
@@ -36,6 +414,10 @@ class ProcessingPipeline(ABC):
         """
         self.stages: List[Any] = []
         self.pipeline_id = pipeline_id
+        self.metrics: Optional[PipelineMetrics] = None
+        self.compiled: Dict[Any, Callable[[Any], Any]] = {}
+        self.recovery: Optional[RecoveryPolicy] = None
+        self.backup: Optional[ProcessingPipeline] = None
 
     def add_stage(self, stage: ProcessingStage) -> None:
         """Add a processing stage to the pipeline.
@@ -44,6 +426,100 @@ class ProcessingPipeline(ABC):
             - stage (ProcessingStage): The stage instance to add.
         """
         self.stages.append(stage)
+        self.compiled.clear()
+
+    def compile(self, kind: type,
+                verbose: bool = False) -> Callable[[Any], Any]:
+        """
+        Fuse the stages into one function specialized for records of
+        type `kind`. Stages with a specialize(kind, verbose) method have
+        their type dispatch resolved now, and stages with nothing to do
+        for this type are left out; other stages keep calling process().
+        The result is cached until a stage is added.
+
+        Every record given to the function must be of type `kind`.
+        Fusing only applies to the silent path: when verbose is True (the
+        adapter banner is printed by process()), or metrics or recovery
+        are enabled, the function simply calls process() instead.
+
+        === Args ===
+            - kind (type): The type of the records (dict, list, str...).
+            - verbose (bool), default to False: Print the stage output.
+
+        === Returns ===
+            - Callable[[Any], Any]: Takes a record and returns the
+            processed record, or None if a stage rejected it.
+        """
+        if verbose or self.metrics is not None or self.recovery is not None:
+            return lambda data: self.process(data, verbose=verbose)
+
+        fused = self.compiled.get((kind, verbose))
+        if fused is not None:
+            return fused
+
+        steps: List[Callable[[Any], Any]] = []
+        for stage in self.stages:
+            specialize = getattr(stage, "specialize", None)
+            if specialize is None:
+                process = stage.process
+                steps.append(lambda data, process=process:
+                             process(data, verbose=verbose))
+                continue
+            step = specialize(kind, verbose)
+            if step is not None:
+                steps.append(step)
+
+        if not steps:
+            def fused(data: Any) -> Any:
+                return data
+        elif len(steps) == 1:
+            fused = steps[0]
+        else:
+            def fused(data: Any) -> Any:
+                for step in steps:
+                    data = step(data)
+                    if data is None:
+                        return None
+                return data
+
+        self.compiled[(kind, verbose)] = fused
+        return fused
+
+    def enable_metrics(self, measure_bytes: bool = False) -> None:
+        """
+        Start recording per-stage counts and latencies
+        (perf_counter_ns) on every record processed.
+
+        === Args ===
+            - measure_bytes (bool), default to False: Also measure the
+            record sizes in and out of each stage.
+        """
+        self.metrics = PipelineMetrics(self.pipeline_id, measure_bytes)
+
+    def enable_recovery(self, retries: int = 2, backoff: float = 0.01,
+                        max_backoff: float = 1.0,
+                        dead_letter: Optional[Callable[[Dict[str, Any]],
+                                                       None]] = None
+                        ) -> RecoveryPolicy:
+        """
+        Isolate failures per record. A stage that raises is retried with
+        an exponential backoff; a record that still fails, or that a stage
+        rejects (returns None), is handed to the backup pipeline if one is
+        set (see NexusManager.add_backup()), and dead-lettered otherwise.
+        The rest of the input keeps flowing either way.
+
+        In micro-batch mode a batch that raises is replayed record by
+        record.
+
+        === Args ===
+            See RecoveryPolicy.
+
+        === Returns ===
+            - RecoveryPolicy: The policy, holding the dead letters.
+        """
+        self.recovery = RecoveryPolicy(retries, backoff, max_backoff,
+                                       dead_letter)
+        return self.recovery
 
     @abstractmethod
     def process(self, data: Any, verbose: bool = True) -> Any:
@@ -57,10 +533,337 @@ class ProcessingPipeline(ABC):
         === Returns ===
             - Any: The final processed data after passing through all stages.
         """
+        if self.recovery is not None:
+            return self._process_guarded(data, verbose)
+        if self.metrics is not None:
+            return self._process_measured(data, verbose)
+
         for stage in self.stages:
             data = stage.process(data, verbose=verbose)
         return data
 
+    def _process_measured(self, data: Any, verbose: bool) -> Any:
+        """Same as process(), timing every stage."""
+        metrics = self.metrics
+        record_in = data
+        pipeline_start = time.perf_counter_ns()
+        for index, stage in enumerate(self.stages):
+            start = time.perf_counter_ns()
+            result = stage.process(data, verbose=verbose)
+            metrics.stage(index, stage).observe(
+                data, result, time.perf_counter_ns() - start)
+            data = result
+        metrics.total.observe(record_in, data,
+                              time.perf_counter_ns() - pipeline_start)
+        return data
+
+    def _process_guarded(self, data: Any, verbose: bool) -> Any:
+        """Same as process(), with the recovery policy applied."""
+        record_in = data
+        pipeline_start = time.perf_counter_ns()
+        for index, stage in enumerate(self.stages):
+            try:
+                data = self._run_stage(index, stage, data, verbose)
+            except Exception as error:
+                return self._recover(record_in, index, stage, error,
+                                     verbose)
+            if data is None:
+                return self._recover(record_in, index, stage, None, verbose)
+        if self.metrics is not None:
+            self.metrics.total.observe(
+                record_in, data, time.perf_counter_ns() - pipeline_start)
+        return data
+
+    def _run_stage(self, index: int, stage: ProcessingStage, data: Any,
+                   verbose: bool) -> Any:
+        """Run one stage on one record, retrying if it raises."""
+        recovery = self.recovery
+        attempt = 0
+        while True:
+            start = time.perf_counter_ns()
+            try:
+                result = stage.process(data, verbose=verbose)
+            except Exception:
+                if attempt >= recovery.retries:
+                    raise
+                time.sleep(recovery.delay(attempt))
+                recovery.retried += 1
+                attempt += 1
+                continue
+            if self.metrics is not None:
+                self.metrics.stage(index, stage).observe(
+                    data, result, time.perf_counter_ns() - start)
+            return result
+
+    def _recover(self, record: Any, index: int, stage: ProcessingStage,
+                 error: Optional[Exception], verbose: bool) -> Any:
+        """
+        Fail over to the backup pipeline, or dead-letter the record.
+
+        === Returns ===
+            - Any: The backup result, None if the record was dead-lettered.
+        """
+        recovery = self.recovery
+        if self.backup is not None:
+            try:
+                result = self.backup.process(record, verbose=verbose)
+            except Exception as backup_error:
+                error, result = backup_error, None
+            if result is not None:
+                recovery.failovers += 1
+                return result
+
+        recovery.dead_letter({
+            "pipeline": self.pipeline_id,
+            "stage": f"{index}:{type(stage).__name__}",
+            "error": "rejected" if error is None else repr(error),
+            "record": record,
+        })
+        return None
+
+    def stream(self, records: Iterable[Any], verbose: bool = False,
+               batch_size: Optional[int] = None) -> Iterator[Any]:
+        """
+        Lazily push records through the stages, one at a time. Each stage
+        is a generator reading from the previous one, so memory stays
+        constant whatever the size of the input.
+
+        A stage can provide its own process_stream(records, verbose)
+        generator; otherwise its process() is called per record. Records
+        a stage rejects (returns None) are dropped.
+
+        With batch_size, records are grouped in micro-batches instead and
+        each batch goes through process_batch() (see process_batch()).
+
+        === Args ===
+            - records (Iterable[Any]): Any iterable (file, generator...).
+            - verbose (bool), default to False: Print the stage output.
+            - batch_size (Optional[int]), default to None: Micro-batch
+            size, None to process records one at a time.
+
+        === Returns ===
+            - Iterator[Any]: The processed records.
+        """
+        if batch_size is not None:
+            return self._batched_stream(records, batch_size, verbose)
+        if self.recovery is not None:
+            return (result for result
+                    in (self._process_guarded(record, verbose)
+                        for record in records)
+                    if result is not None)
+
+        if self.metrics is not None:
+            return self._measured_stream(records, verbose)
+
+        iterator: Iterator[Any] = iter(records)
+        for index, stage in enumerate(self.stages):
+            iterator = self._stage_stream(stage, iterator, verbose)
+        return iterator
+
+    def _batched_stream(self, records: Iterable[Any], batch_size: int,
+                        verbose: bool) -> Iterator[Any]:
+        """Group records in micro-batches and run process_batch()."""
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) == batch_size:
+                yield from self.process_batch(batch, verbose=verbose)
+                batch = []
+        if batch:
+            yield from self.process_batch(batch, verbose=verbose)
+
+    def process_batch(self, batch: List[Any],
+                      verbose: bool = False) -> List[Any]:
+        """
+        Run a micro-batch through the stages. Stages with a
+        process_batch(batch, verbose) method get the whole batch, so their
+        setup cost is paid once; the others fall back to process() per
+        record. Rejected records (None) are dropped.
+
+        With recovery enabled, a stage whose batch call raises (or does
+        not return one result per record) is replayed record by record
+        with retries, and every failed or rejected record goes through
+        the recovery policy on its own.
+
+        === Args ===
+            - batch (List[Any]): The records.
+            - verbose (bool), default to False: Print the stage output.
+
+        === Returns ===
+            - List[Any]: The processed records, followed by the ones
+            recovered by the backup pipeline.
+        """
+        # The input record behind each entry of `batch`, for recovery
+        origins = batch
+        recovered = []
+        records_in = batch
+        pipeline_start = time.perf_counter_ns()
+        for index, stage in enumerate(self.stages):
+            if not batch:
+                break
+            if self.recovery is not None:
+                batch, origins = self._recover_batch(
+                    index, stage, batch, origins, recovered, verbose)
+                continue
+
+            start = time.perf_counter_ns()
+            process_batch = getattr(stage, "process_batch", None)
+            if process_batch is not None:
+                results = process_batch(batch, verbose=verbose)
+            else:
+                process = stage.process
+                results = [process(item, verbose=verbose) for item in batch]
+            result = [record for record in results if record is not None]
+            if self.metrics is not None:
+                self.metrics.stage(index, stage).observe_batch(
+                    batch, result, time.perf_counter_ns() - start)
+            batch = result
+        batch += recovered
+        if self.metrics is not None:
+            self.metrics.total.observe_batch(
+                records_in, batch, time.perf_counter_ns() - pipeline_start)
+        return batch
+
+    def _recover_batch(self, index: int, stage: ProcessingStage,
+                       batch: List[Any], origins: List[Any],
+                       recovered: List[Any], verbose: bool
+                       ) -> Tuple[List[Any], List[Any]]:
+        """
+        Run one stage of process_batch() with the recovery policy.
+
+        === Returns ===
+            - Tuple[List[Any], List[Any]]: The records kept and the input
+            records behind them; records recovered by the backup pipeline
+            are appended to `recovered`.
+        """
+        start = time.perf_counter_ns()
+        results: Optional[List[Any]] = None
+        process_batch = getattr(stage, "process_batch", None)
+        if process_batch is not None:
+            try:
+                results = list(process_batch(batch, verbose=verbose))
+            except Exception:
+                results = None
+            if results is not None and len(results) != len(batch):
+                results = None
+        if results is not None:
+            errors: List[Optional[Exception]] = [None] * len(batch)
+            if self.metrics is not None:
+                self.metrics.stage(index, stage).observe_batch(
+                    batch, [record for record in results
+                            if record is not None],
+                    time.perf_counter_ns() - start)
+        else:
+            results, errors = [], []
+            for item in batch:
+                try:
+                    results.append(self._run_stage(index, stage, item,
+                                                   verbose))
+                    errors.append(None)
+                except Exception as error:
+                    results.append(None)
+                    errors.append(error)
+
+        kept, kept_origins = [], []
+        for origin, record, error in zip(origins, results, errors):
+            if record is not None:
+                kept.append(record)
+                kept_origins.append(origin)
+                continue
+            record = self._recover(origin, index, stage, error, verbose)
+            if record is not None:
+                recovered.append(record)
+        return kept, kept_origins
+
+    def _measured_stream(self, records: Iterable[Any],
+                         verbose: bool) -> Iterator[Any]:
+        """
+        Same as the stage generators of stream(), one record at a time
+        through every stage so that both the stages and the whole
+        pipeline are timed.
+        """
+        metrics = self.metrics
+        stages = [(metrics.stage(index, stage), stage.process)
+                  for index, stage in enumerate(self.stages)]
+        for record in records:
+            data = record
+            pipeline_start = time.perf_counter_ns()
+            for stage_metrics, process in stages:
+                start = time.perf_counter_ns()
+                result = process(data, verbose=verbose)
+                stage_metrics.observe(data, result,
+                                      time.perf_counter_ns() - start)
+                data = result
+                if data is None:
+                    break
+            metrics.total.observe(record, data,
+                                  time.perf_counter_ns() - pipeline_start)
+            if data is not None:
+                yield data
+
+    @staticmethod
+    def _stage_stream(stage: ProcessingStage, records: Iterator[Any],
+                      verbose: bool) -> Iterator[Any]:
+        """Run one stage over a record iterator."""
+        process_stream = getattr(stage, "process_stream", None)
+        if process_stream is not None:
+            yield from process_stream(records, verbose=verbose)
+            return
+
+        process = stage.process
+        for record in records:
+            result = process(record, verbose=verbose)
+            if result is not None:
+                yield result
+
+
+def read_json_lines(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily read a JSON lines file, one record per line.
+
+    === Args ===
+        - path (str): The file to read.
+
+    === Returns ===
+        - Iterator[Dict[str, Any]]: The decoded records.
+    """
+    with open(path, "r") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_csv_rows(path: str) -> Iterator[List[str]]:
+    """
+    Lazily read a CSV file, one row at a time.
+
+    === Args ===
+        - path (str): The file to read.
+
+    === Returns ===
+        - Iterator[List[str]]: The rows.
+    """
+    with open(path, "r", newline="") as file:
+        yield from csv.reader(file)
+
+
+def type_key(kind: type) -> Optional[str]:
+    """
+    Map a record type to the branch the built-in stages use for it.
+
+    === Args ===
+        - kind (type): The record type.
+
+    === Returns ===
+        - Optional[str]: 'dict', 'list', 'str' or None for other types.
+    """
+    for key, base in (("dict", dict), ("list", list), ("str", str)):
+        if issubclass(kind, base):
+            return key
+    return None
+
 
 class InputStage():
     """Stage responsible for initial data validation and parsing."""
@@ -69,46 +872,143 @@ class InputStage():
         """Display and pass through the input data."""
         if verbose is True:
             if isinstance(data, dict):
-                print(f"Input: {data}")
+                self._show(data)
 
             elif isinstance(data, list):
-                fdata = ",".join(str(x) for x in data)
-                print(f"Input: \"{fdata}\"")
+                self._show_list(data)
 
             elif isinstance(data, str):
-                print(f"Input: {data}")
+                self._show(data)
 
             else:
-                print("Error detected in Stage 1: invalid input")
+                self._show_invalid(data)
+        return data
+
+    def process_batch(self, batch: List[Any],
+                      verbose: bool = True) -> List[Any]:
+        """Display a micro-batch; a no-op when not verbose."""
+        if verbose is not True:
+            return batch
+        return [self.process(data, verbose=True) for data in batch]
+
+    def specialize(self, kind: type,
+                   verbose: bool) -> Optional[Callable[[Any], Any]]:
+        """
+        Return the process() branch for one record type, resolved once.
+
+        === Args ===
+            - kind (type): The type of every record.
+            - verbose (bool): Print the output.
+
+        === Returns ===
+            - Optional[Callable[[Any], Any]]: The specialized function, or
+            None when the stage does nothing for this type.
+        """
+        if verbose is not True:
+            return None
+        return {"dict": self._show, "list": self._show_list,
+                "str": self._show}.get(type_key(kind), self._show_invalid)
+
+    def _show(self, data: Any) -> Any:
+        """Display a JSON or stream input."""
+        print(f"Input: {data}")
+        return data
+
+    def _show_list(self, data: List[Any]) -> Any:
+        """Display a CSV input."""
+        fdata = ",".join(str(x) for x in data)
+        print(f"Input: \"{fdata}\"")
+        return data
+
+    def _show_invalid(self, data: Any) -> Any:
+        """Report an input of an unsupported type."""
+        print("Error detected in Stage 1: invalid input")
         return data
 
 
 class TransformStage():
     """Stage responsible for formatting and delivering final results."""
 
+    MESSAGES = {"dict": "Transform: Enriched with metadata and validation",
+                "list": "Transform: Parsed and structured data",
+                "str": "Transform: Aggregated and filtered"}
+
     def process(self, data: Any, verbose: bool = True) -> Any:
         """Apply transformations to the data."""
         if isinstance(data, dict):
-            try:
-                if not data.get("value") or not data.get("unit"):
-                    raise KeyError
-                float(data.get("value"))
-                if not isinstance(data.get("unit"), str):
-                    raise ValueError
-            except (KeyError, ValueError):
-                print("Error detected in Stage 2: invalid data format")
+            if self._validate(data) is None:
                 return None
 
             if verbose is True:
-                print("Transform: Enriched with metadata and validation")
+                print(self.MESSAGES["dict"])
 
         elif isinstance(data, list):
             if verbose is True:
-                print("Transform: Parsed and structured data")
+                print(self.MESSAGES["list"])
 
         elif isinstance(data, str):
             if verbose is True:
-                print("Transform: Aggregated and filtered")
+                print(self.MESSAGES["str"])
+        return data
+
+    def process_batch(self, batch: List[Any],
+                      verbose: bool = True) -> List[Any]:
+        """
+        Transform a micro-batch. When not verbose, only the JSON readings
+        need work, so the rest of the batch is kept as is.
+        """
+        if verbose is True:
+            return [self.process(data, verbose=True) for data in batch]
+        validate = self._validate
+        return [validate(data) if isinstance(data, dict) else data
+                for data in batch]
+
+    def specialize(self, kind: type,
+                   verbose: bool) -> Optional[Callable[[Any], Any]]:
+        """
+        Return the process() branch for one record type, resolved once.
+
+        === Args ===
+            - kind (type): The type of every record.
+            - verbose (bool): Print the output.
+
+        === Returns ===
+            - Optional[Callable[[Any], Any]]: The specialized function, or
+            None when the stage does nothing for this type.
+        """
+        key = type_key(kind)
+        message = self.MESSAGES.get(key)
+
+        if key == "dict":
+            if verbose is not True:
+                return self._validate
+
+            def transform(data: Dict[str, Any]) -> Any:
+                if self._validate(data) is None:
+                    return None
+                print(message)
+                return data
+            return transform
+
+        if message is None or verbose is not True:
+            return None
+
+        def announce(data: Any) -> Any:
+            print(message)
+            return data
+        return announce
+
+    def _validate(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Check a JSON reading, None if it is invalid."""
+        try:
+            if not data.get("value") or not data.get("unit"):
+                raise KeyError
+            float(data.get("value"))
+            if not isinstance(data.get("unit"), str):
+                raise ValueError
+        except (KeyError, ValueError):
+            print("Error detected in Stage 2: invalid data format")
+            return None
         return data
 
 
@@ -119,23 +1019,63 @@ class OutputStage():
         """Format and display the final processing result."""
         if verbose is True:
             if isinstance(data, dict):
-                temp = data.get("value")
-                unit = data.get("unit")
-
-                print(f"Output: Processed temperature reading: {temp}°{unit} "
-                      "(Normal range)")
+                self._show_dict(data)
 
             elif isinstance(data, list):
-                action = 0
-                for item in data:
-                    if item == "action":
-                        action += 1
-
-                print(f"Output: user activity logged: {action} actions "
-                      "processed")
+                self._show_list(data)
 
             elif isinstance(data, str):
-                print("Output: Stream summary: 5 readings, avg: 22.1°C")
+                self._show_str(data)
+        return data
+
+    def process_batch(self, batch: List[Any],
+                      verbose: bool = True) -> List[Any]:
+        """Display a micro-batch; a no-op when not verbose."""
+        if verbose is not True:
+            return batch
+        return [self.process(data, verbose=True) for data in batch]
+
+    def specialize(self, kind: type,
+                   verbose: bool) -> Optional[Callable[[Any], Any]]:
+        """
+        Return the process() branch for one record type, resolved once.
+
+        === Args ===
+            - kind (type): The type of every record.
+            - verbose (bool): Print the output.
+
+        === Returns ===
+            - Optional[Callable[[Any], Any]]: The specialized function, or
+            None when the stage does nothing for this type.
+        """
+        if verbose is not True:
+            return None
+        return {"dict": self._show_dict, "list": self._show_list,
+                "str": self._show_str}.get(type_key(kind))
+
+    def _show_dict(self, data: Dict[str, Any]) -> Any:
+        """Display a temperature reading."""
+        temp = data.get("value")
+        unit = data.get("unit")
+
+        print(f"Output: Processed temperature reading: {temp}°{unit} "
+              "(Normal range)")
+        return data
+
+    def _show_list(self, data: List[Any]) -> Any:
+        """Display the number of actions of a CSV row."""
+        action = 0
+        for item in data:
+            if item == "action":
+                action += 1
+
+        print(f"Output: user activity logged: {action} actions "
+              "processed")
+        return data
+
+    def _show_str(self, data: str) -> Any:
+        """Display the stream summary."""
+        print("Output: Stream summary: 5 readings, avg: 22.1°C")
         return data
 
 
@@ -196,12 +1136,257 @@ class StreamAdapter(ProcessingPipeline):
         return super().process(data=data, verbose=verbose)
 
 
+class BoundedBuffer():
+    """
+    Thread-safe FIFO between two pipelines, holding at most high_watermark
+    records in memory.
+
+    Once the buffer reaches its high watermark it stays full until the
+    consumer drains it down to the low watermark, then the producer is let
+    in again. What happens to records put while full depends on the
+    policy:
+        - 'block': the producer waits.
+        - 'drop': the record is discarded and counted.
+        - 'spill': the record is pickled to a temporary file, and read
+        back in order once memory has drained.
+    """
+
+    POLICIES = ("block", "drop", "spill")
+
+    def __init__(self, name: str, high_watermark: int = 1024,
+                 low_watermark: Optional[int] = None,
+                 policy: str = "block") -> None:
+        """
+        Initialize the buffer.
+
+        === Args ===
+            - name (str): Name used in the metrics.
+            - high_watermark (int), default to 1024: Records in memory
+            before the buffer is full.
+            - low_watermark (Optional[int]), default to None: Depth at
+            which the producer resumes (half the high watermark if None).
+            - policy (str), default to 'block': 'block', 'drop' or 'spill'.
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown buffer policy: {policy}")
+        if high_watermark < 1:
+            raise ValueError("high_watermark must be at least 1")
+        if low_watermark is None:
+            low_watermark = high_watermark // 2
+        if not 0 <= low_watermark < high_watermark:
+            raise ValueError("low_watermark must be in [0, high_watermark)")
+        self.name = name
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+        self.policy = policy
+        self.records: deque = deque()
+        self.full = False
+        self.closed = False
+        self.cancelled = False
+        self.max_depth = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.spill_file: Optional[Any] = None
+        self.spill_pending = 0
+        self.spill_read = 0
+        self.condition = threading.Condition()
+
+    def put(self, record: Any) -> bool:
+        """
+        Add a record, following the policy when the buffer is full.
+
+        === Args ===
+            - record (Any): The record.
+
+        === Returns ===
+            - bool: False if the record was dropped or the buffer cancelled.
+        """
+        with self.condition:
+            if self.policy == "block":
+                while self.full and not self.cancelled:
+                    self.condition.wait()
+            if self.cancelled:
+                return False
+            if self.policy == "drop" and self.full:
+                self.dropped += 1
+                return False
+            if self.policy == "spill" and (self.full or self.spill_pending):
+                self._spill(record)
+                return True
+            self.records.append(record)
+            self.max_depth = max(self.max_depth, len(self.records))
+            if len(self.records) >= self.high_watermark:
+                self.full = True
+            self.condition.notify_all()
+            return True
+
+    def close(self) -> None:
+        """Mark the end of the input; readers stop once it is drained."""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def cancel(self) -> None:
+        """Stop both sides now and discard whatever is left."""
+        with self.condition:
+            self.cancelled = True
+            self.records.clear()
+            self._discard_spill()
+            self.condition.notify_all()
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the records in order until the buffer is closed."""
+        while True:
+            with self.condition:
+                while (not self.records and not self.spill_pending
+                       and not self.closed and not self.cancelled):
+                    self.condition.wait()
+                if self.cancelled:
+                    return
+                if not self.records and self.spill_pending:
+                    self._unspill()
+                if not self.records:
+                    return
+                record = self.records.popleft()
+                if self.full and len(self.records) <= self.low_watermark:
+                    self.full = False
+                    self.condition.notify_all()
+            yield record
+
+    def _spill(self, record: Any) -> None:
+        """Append a record to the spill file (lock held)."""
+        if self.spill_file is None:
+            self.spill_file = tempfile.TemporaryFile()
+        self.spill_file.seek(0, 2)
+        pickle.dump(record, self.spill_file,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+        self.spill_pending += 1
+        self.spilled += 1
+        self.condition.notify_all()
+
+    def _unspill(self) -> None:
+        """Load spilled records back, up to the high watermark (lock held)."""
+        self.spill_file.seek(self.spill_read)
+        count = min(self.spill_pending, self.high_watermark)
+        for _ in range(count):
+            self.records.append(pickle.load(self.spill_file))
+        self.spill_read = self.spill_file.tell()
+        self.spill_pending -= count
+        if not self.spill_pending:
+            self._discard_spill()
+        self.full = len(self.records) >= self.high_watermark
+
+    def _discard_spill(self) -> None:
+        """Delete the spill file (lock held)."""
+        if self.spill_file is not None:
+            self.spill_file.close()
+            self.spill_file = None
+        self.spill_pending = 0
+        self.spill_read = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        === Returns ===
+            - Dict[str, int]: Current and maximum depth in memory, records
+            waiting on disk, dropped and spilled totals.
+        """
+        with self.condition:
+            return {"last": len(self.records), "max": self.max_depth,
+                    "on_disk": self.spill_pending,
+                    "dropped": self.dropped, "spilled": self.spilled}
+
+
+class WorkerFailure():
+    """Marker a worker process sends downstream when its pipeline raised."""
+
+    def __init__(self, pipeline_id: Optional[str],
+                 error: BaseException) -> None:
+        """
+        Initialize the marker.
+
+        === Args ===
+            - pipeline_id (Optional[str]): The pipeline that failed (None
+            for the input iterable).
+            - error (BaseException): The exception, replaced by a
+            RuntimeError with its repr if it cannot be pickled.
+        """
+        try:
+            pickle.dumps(error)
+        except Exception:
+            error = RuntimeError(repr(error))
+        self.pipeline_id = pipeline_id
+        self.error = error
+
+
+class WorkerMetrics():
+    """Metrics a worker process sends downstream before it stops."""
+
+    def __init__(self, position: int, metrics: PipelineMetrics) -> None:
+        """
+        Initialize the marker.
+
+        === Args ===
+            - position (int): Index of the pipeline in the chain.
+            - metrics (PipelineMetrics): What the worker measured.
+        """
+        self.position = position
+        self.metrics = metrics
+
+
+def pipeline_worker(pipeline: ProcessingPipeline,
+                    inbox: multiprocessing.Queue,
+                    outbox: multiprocessing.Queue,
+                    position: int = 0) -> None:
+    """
+    Worker process loop: run chunks of records through one pipeline until
+    the None marker arrives. If the pipeline raises, or a WorkerFailure
+    comes from upstream, the failure is sent downstream and the worker
+    stops. With metrics enabled, the worker measures from zero and sends
+    a WorkerMetrics downstream when it stops; upstream ones are forwarded.
+
+    === Args ===
+        - pipeline (ProcessingPipeline): The pipeline to run.
+        - inbox (multiprocessing.Queue): Chunks to process.
+        - outbox (multiprocessing.Queue): Processed chunks.
+        - position (int), default to 0: Index of the pipeline in the
+        chain, sent back with the metrics.
+    """
+    if pipeline.metrics is not None:
+        pipeline.enable_metrics(pipeline.metrics.measure_bytes)
+    while True:
+        chunk = inbox.get()
+        if chunk is None:
+            if pipeline.metrics is not None:
+                outbox.put(WorkerMetrics(position, pipeline.metrics))
+            return
+        if isinstance(chunk, WorkerMetrics):
+            outbox.put(chunk)
+            continue
+        if isinstance(chunk, WorkerFailure):
+            outbox.put(chunk)
+            return
+        try:
+            results = list(pipeline.stream(chunk))
+        except Exception as error:
+            outbox.put(WorkerFailure(pipeline.pipeline_id, error))
+            return
+        if results:
+            outbox.put(results)
+
+
+# DAG edge: (target pipeline ID, record types routed or None for all)
+Route = Tuple[str, Optional[Tuple[type, ...]]]
+
+
 class NexusManager():
     """Manager class responsible for orchestrating multiple pipelines."""
 
     def __init__(self) -> None:
         """Initialize the manager"""
         self.pipelines = []
+        self.queue_depths: Dict[str, Dict[str, int]] = {}
+        self.buffers: List[BoundedBuffer] = []
+        self.edges: Dict[str, List[Route]] = {}
 
     def add_pipeline(self, stage: ProcessingPipeline) -> None:
         """
@@ -212,6 +1397,165 @@ class NexusManager():
         """
         self.pipelines.append(stage)
 
+    def add_backup(self, pipeline: ProcessingPipeline,
+                   backup: ProcessingPipeline) -> None:
+        """
+        Register a backup taking over the records `pipeline` fails on.
+        Recovery is enabled on `pipeline` with the default policy if it
+        was not already.
+
+        === Args ===
+            - pipeline (ProcessingPipeline): The primary pipeline.
+            - backup (ProcessingPipeline): The pipeline to fail over to.
+        """
+        if backup is pipeline:
+            raise ValueError("A pipeline cannot be its own backup")
+        pipeline.backup = backup
+        if pipeline.recovery is None:
+            pipeline.enable_recovery()
+
+    def connect(self, source_id: str, target_id: str,
+                when: Union[type, Tuple[type, ...], None] = None) -> None:
+        """
+        Add an edge to the pipeline graph used by process_dag(). Several
+        edges leaving a pipeline fan its output out, several edges reaching
+        it merge their streams.
+
+        === Args ===
+            - source_id (str): The pipeline producing the records.
+            - target_id (str): The pipeline receiving them.
+            - when (type or tuple of types), default to None: Only route
+            records of these types (isinstance check); None routes all.
+        """
+        ids = {str(pipeline.pipeline_id) for pipeline in self.pipelines}
+        for pipeline_id in (source_id, target_id):
+            if pipeline_id not in ids:
+                raise ValueError(f"Unknown pipeline: {pipeline_id}")
+        if source_id == target_id or self._reaches(target_id, source_id):
+            raise ValueError(f"Edge {source_id} -> {target_id} would "
+                             "create a cycle")
+        if isinstance(when, type):
+            when = (when,)
+        self.edges.setdefault(source_id, []).append((target_id, when))
+
+    def _reaches(self, start: str, goal: str) -> bool:
+        """Tell if goal can be reached from start along the edges."""
+        seen = set()
+        pending = [start]
+        while pending:
+            node = pending.pop()
+            if node == goal:
+                return True
+            if node not in seen:
+                seen.add(node)
+                pending.extend(target for target, _
+                               in self.edges.get(node, []))
+        return False
+
+    def process_dag(self, records: Iterable[Any],
+                    high_watermark: int = 1024,
+                    low_watermark: Optional[int] = None,
+                    policy: str = "block") -> Iterator[Tuple[str, Any]]:
+        """
+        Run the pipeline graph built with connect(). The input is read
+        once and sent to every pipeline without incoming edges; each
+        pipeline runs in its own thread, reading a BoundedBuffer fed by
+        its upstream pipelines, so independent branches run concurrently.
+        Fanned-out branches share the same record objects, and records
+        matching none of a pipeline's outgoing edges are dropped.
+
+        === Args ===
+            - records (Iterable[Any]): The input, read lazily.
+            - high_watermark, low_watermark, policy: Settings of every
+            buffer, see BoundedBuffer.
+
+        === Returns ===
+            - Iterator[Tuple[str, Any]]: (pipeline ID, record) for every
+            record leaving a pipeline without outgoing edges, in the order
+            they come out.
+        """
+        nodes = {str(pipeline.pipeline_id): pipeline
+                 for pipeline in self.pipelines}
+        inboxes = {node: BoundedBuffer(node, high_watermark, low_watermark,
+                                       policy) for node in nodes}
+        output = BoundedBuffer("output", high_watermark, low_watermark,
+                               policy)
+        self.buffers = list(inboxes.values()) + [output]
+
+        # Writers left per buffer; it is closed when the last one is done
+        writers = {node: 0 for node in nodes}
+        writers["output"] = 0
+        for node in nodes:
+            for target, _ in self.edges.get(node, []):
+                writers[target] += 1
+            if not self.edges.get(node):
+                writers["output"] += 1
+        sources = [node for node, count in writers.items()
+                   if count == 0 and node != "output"]
+        if not writers["output"]:
+            output.close()
+        lock = threading.Lock()
+        errors: List[BaseException] = []
+
+        def release(name: str) -> None:
+            with lock:
+                writers[name] -= 1
+                done = writers[name] == 0
+            if done:
+                (output if name == "output" else inboxes[name]).close()
+
+        def fail(error: BaseException) -> None:
+            errors.append(error)
+            for buffer in self.buffers:
+                buffer.cancel()
+
+        def feed() -> None:
+            try:
+                for record in records:
+                    for node in sources:
+                        inboxes[node].put(record)
+                    if output.cancelled:
+                        return
+            except BaseException as error:
+                fail(error)
+            finally:
+                for node in sources:
+                    inboxes[node].close()
+
+        def run(node: str) -> None:
+            edges = self.edges.get(node, [])
+            try:
+                for record in nodes[node].stream(inboxes[node]):
+                    if output.cancelled:
+                        return
+                    if not edges:
+                        output.put((node, record))
+                    for target, kinds in edges:
+                        if kinds is None or isinstance(record, kinds):
+                            inboxes[target].put(record)
+            except BaseException as error:
+                fail(error)
+            finally:
+                for target, _ in edges:
+                    release(target)
+                if not edges:
+                    release("output")
+
+        threads = [threading.Thread(target=feed, daemon=True)]
+        threads += [threading.Thread(target=run, args=(node,), daemon=True)
+                    for node in nodes]
+        for thread in threads:
+            thread.start()
+        try:
+            yield from output
+        finally:
+            for buffer in self.buffers:
+                buffer.cancel()
+            for thread in threads:
+                thread.join()
+        if errors:
+            raise errors[0]
+
     def process_chain(self, data: Any) -> None:
         """Process pipeline to each other"""
         pipeline_list = [id.pipeline_id for id in self.pipelines]
@@ -219,16 +1563,16 @@ class NexusManager():
         print(result)
         print("Data flow: Raw -> Processed -> Analyzed -> Stored")
 
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         for pipeline in self.pipelines:
             data = pipeline.process(data, verbose=False)
-        end_time = time.time()
+        end_time = time.perf_counter_ns()
 
         print(f"Chain result: {len(data)} records processed throught "
               f"{len(pipeline_list)}-stage pipeline")
 
         performance = 0
-        processing_time = end_time - start_time
+        processing_time = (end_time - start_time) / 1e9
         if processing_time >= 0 and processing_time <= 1:
             performance = 100
         elif processing_time >= 2 and processing_time <= 10:
@@ -245,6 +1589,266 @@ class NexusManager():
         print(f"Performance: {performance}% efficiency, "
               f"{processing_time:.1f}s total processing time")
 
+    def process_pipelined(self, records: Iterable[Any],
+                          replicas: Optional[Dict[str, int]] = None,
+                          queue_size: int = 64,
+                          chunk_size: int = 256) -> Iterator[Any]:
+        """
+        Run the chain with every pipeline in its own worker process(es),
+        linked by bounded queues, so the throughput is set by the slowest
+        pipeline instead of the sum of all of them.
+
+        Records travel in chunks of chunk_size to amortize the IPC cost.
+        With more than one replica, a pipeline's output order is not kept.
+        An exception raised by a pipeline or by the input iterable is
+        re-raised here, and a worker dying without one raises
+        RuntimeError; the other workers are then stopped.
+
+        === Args ===
+            - records (Iterable[Any]): The input, read lazily.
+            - replicas (Optional[Dict[str, int]]), default to None: Worker
+            processes per pipeline ID (1 when missing).
+            - queue_size (int), default to 64: Chunks buffered between two
+            pipelines before the producer blocks.
+            - chunk_size (int), default to 256: Records per chunk.
+
+        === Returns ===
+            - Iterator[Any]: The records coming out of the last pipeline.
+        """
+        replicas = replicas or {}
+        queues = [multiprocessing.Queue(maxsize=queue_size)
+                  for _ in range(len(self.pipelines) + 1)]
+        stages: List[List[multiprocessing.Process]] = []
+        for index, pipeline in enumerate(self.pipelines):
+            workers = [multiprocessing.Process(
+                target=pipeline_worker, daemon=True,
+                args=(pipeline, queues[index], queues[index + 1], index))
+                for _ in range(max(replicas.get(pipeline.pipeline_id, 1), 1))]
+            for worker in workers:
+                worker.start()
+            stages.append(workers)
+
+        stopped = threading.Event()
+
+        def put(queue: multiprocessing.Queue, item: Any) -> bool:
+            # Time out regularly so a dead consumer cannot block us forever
+            while not stopped.is_set():
+                try:
+                    queue.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        def feed() -> None:
+            try:
+                read_input()
+            except BaseException as error:
+                # The consumer re-raises it and stops the workers
+                put(queues[-1], WorkerFailure(None, error))
+
+        def read_input() -> None:
+            chunk = []
+            for record in records:
+                chunk.append(record)
+                if len(chunk) == chunk_size:
+                    if not put(queues[0], chunk):
+                        return
+                    chunk = []
+            if chunk and not put(queues[0], chunk):
+                return
+            # Stop each stage once the previous one has fully drained
+            for index, workers in enumerate(stages):
+                for _ in workers:
+                    if not put(queues[index], None):
+                        return
+                for worker in workers:
+                    while worker.is_alive() and not stopped.is_set():
+                        worker.join(timeout=0.1)
+                    if worker.exitcode not in (None, 0):
+                        # Lost chunks: let the consumer raise
+                        return
+            put(queues[-1], None)
+
+        feeder = threading.Thread(target=feed, daemon=True)
+        feeder.start()
+        names = [str(pipeline.pipeline_id)
+                 for pipeline in self.pipelines] + ["output"]
+        self.queue_depths = {name: {"last": 0, "max": 0} for name in names}
+        try:
+            while True:
+                self._sample_queues(names, queues)
+                try:
+                    chunk = queues[-1].get(timeout=0.1)
+                except Empty:
+                    self._check_workers(stages)
+                    continue
+                if chunk is None:
+                    break
+                if isinstance(chunk, WorkerFailure):
+                    raise chunk.error
+                if isinstance(chunk, WorkerMetrics):
+                    self.pipelines[chunk.position].metrics.merge(
+                        chunk.metrics)
+                    continue
+                yield from chunk
+        finally:
+            stopped.set()
+            for workers in stages:
+                for worker in workers:
+                    if worker.is_alive():
+                        worker.terminate()
+            feeder.join()
+
+    def _check_workers(self, stages: List[List[multiprocessing.Process]]
+                       ) -> None:
+        """Raise RuntimeError if a worker process died abnormally."""
+        for pipeline, workers in zip(self.pipelines, stages):
+            for worker in workers:
+                if worker.exitcode not in (None, 0):
+                    raise RuntimeError(
+                        f"Worker of pipeline {pipeline.pipeline_id} exited "
+                        f"with code {worker.exitcode}")
+
+    def process_buffered(self, records: Iterable[Any],
+                         high_watermark: int = 1024,
+                         low_watermark: Optional[int] = None,
+                         policy: str = "block") -> Iterator[Any]:
+        """
+        Run the chain with every pipeline in its own thread, each one
+        writing into a BoundedBuffer read by the next. Memory stays bounded
+        by the watermarks however unbalanced the pipelines are.
+
+        === Args ===
+            - records (Iterable[Any]): The input, read lazily.
+            - high_watermark (int), default to 1024: Records each buffer
+            holds in memory before it is full.
+            - low_watermark (Optional[int]), default to None: Depth at
+            which a full buffer accepts records again.
+            - policy (str), default to 'block': What to do with records put
+            into a full buffer ('block', 'drop' or 'spill').
+
+        === Returns ===
+            - Iterator[Any]: The records coming out of the last pipeline.
+        """
+        self.buffers = [BoundedBuffer(str(pipeline.pipeline_id),
+                                      high_watermark, low_watermark, policy)
+                        for pipeline in self.pipelines]
+        errors: List[BaseException] = []
+
+        def run(pipeline: ProcessingPipeline, source: Iterable[Any],
+                buffer: BoundedBuffer) -> None:
+            try:
+                for record in pipeline.stream(source):
+                    if not buffer.put(record) and buffer.cancelled:
+                        return
+            except BaseException as error:
+                errors.append(error)
+                for other in self.buffers:
+                    other.cancel()
+            finally:
+                buffer.close()
+
+        sources = [records] + self.buffers[:-1]
+        threads = [threading.Thread(target=run, daemon=True,
+                                    args=(pipeline, source, buffer))
+                   for pipeline, source, buffer
+                   in zip(self.pipelines, sources, self.buffers)]
+        for thread in threads:
+            thread.start()
+        try:
+            if self.buffers:
+                yield from self.buffers[-1]
+            else:
+                yield from records
+        finally:
+            for buffer in self.buffers:
+                buffer.cancel()
+            for thread in threads:
+                thread.join()
+        if errors:
+            raise errors[0]
+
+    @staticmethod
+    def _queue_depth(queue: multiprocessing.Queue) -> int:
+        """Approximate queue size (0 where qsize() is unsupported)."""
+        try:
+            return queue.qsize()
+        except NotImplementedError:
+            return 0
+
+    def _sample_queues(self, names: List[str],
+                       queues: List[multiprocessing.Queue]) -> None:
+        """Record the current depth of every inter-pipeline queue."""
+        for name, queue in zip(names, queues):
+            depth = self._queue_depth(queue)
+            stats = self.queue_depths[name]
+            stats["last"] = depth
+            stats["max"] = max(stats["max"], depth)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Collect the metrics of every pipeline with metrics enabled, the
+        queue depths (in chunks) of the last process_pipelined() run,
+        keyed by the pipeline reading from the queue ('output' for the
+        results queue), the buffers of the last process_buffered() run,
+        keyed by the pipeline writing into them, and the recovery counters
+        of every pipeline with recovery enabled.
+
+        === Returns ===
+            - Dict[str, Any]: 'pipelines', 'queues', 'buffers' and
+            'recovery'.
+        """
+        return {"pipelines": {str(pipeline.pipeline_id):
+                              pipeline.metrics.as_dict()
+                              for pipeline in self.pipelines
+                              if pipeline.metrics is not None},
+                "queues": self.queue_depths,
+                "buffers": {buffer.name: buffer.stats()
+                            for buffer in self.buffers},
+                "recovery": {str(pipeline.pipeline_id):
+                             pipeline.recovery.as_dict()
+                             for pipeline in self.pipelines
+                             if pipeline.recovery is not None}}
+
+    def to_prometheus(self) -> str:
+        """
+        Export every metric in the Prometheus text exposition format.
+
+        === Returns ===
+            - str: The exposition text.
+        """
+        sources = [pipeline.metrics.prometheus_samples()
+                   for pipeline in self.pipelines
+                   if pipeline.metrics is not None]
+        sources.append({"nexus_queue_depth": [
+            f'nexus_queue_depth{{queue="{name}"}} {depth["last"]}'
+            for name, depth in self.queue_depths.items()]})
+        buffers = [buffer.stats() | {"name": buffer.name}
+                   for buffer in self.buffers]
+        sources.append({
+            "nexus_queue_depth": [
+                f'nexus_queue_depth{{buffer="{stats["name"]}"}} '
+                f'{stats["last"]}' for stats in buffers],
+            "nexus_buffer_dropped_total": [
+                f'nexus_buffer_dropped_total{{buffer="{stats["name"]}"}} '
+                f'{stats["dropped"]}' for stats in buffers],
+            "nexus_buffer_spilled_total": [
+                f'nexus_buffer_spilled_total{{buffer="{stats["name"]}"}} '
+                f'{stats["spilled"]}' for stats in buffers]})
+        recovery = {str(pipeline.pipeline_id): pipeline.recovery.as_dict()
+                    for pipeline in self.pipelines
+                    if pipeline.recovery is not None}
+        sources.append({
+            f"nexus_{name}_total": [
+                f'nexus_{name}_total{{pipeline="{pipeline_id}"}} '
+                f'{counters[key]}'
+                for pipeline_id, counters in recovery.items()]
+            for name, key in (("retries", "retried"),
+                              ("failovers", "failovers"),
+                              ("dead_letters", "dead_lettered"))})
+        return format_prometheus(sources)
+
 
 def main() -> None:
     """
@@ -307,11 +1911,18 @@ def main() -> None:
     pipeline = JSONAdapter("pipeline_error")
     for stage in stage_list:
         pipeline.add_stage(stage)
-    error = pipeline.process({"sensor": "temp", "value": 23.5, "unit": 666},
-                             verbose=False)
-    if error is None:
+    # The backup stores raw readings without the validation stage
+    backup = JSONAdapter("pipeline_backup")
+    backup.add_stage(InputStage())
+    backup.add_stage(OutputStage())
+    manager.add_backup(pipeline, backup)
+    result = pipeline.process({"sensor": "temp", "value": 23.5, "unit": 666},
+                              verbose=False)
+    if pipeline.recovery.failovers:
         print("Recovery initiated: Switching to backup processor")
-        print("Recovery successful: Pipeline restored, processing resumed")
+        if result is not None:
+            print("Recovery successful: Pipeline restored, "
+                  "processing resumed")
 
     print("\nNexus Integration complete. All systems operational.")
 